@@ -2,7 +2,6 @@
 from sys import exit
 from time import sleep
 from os import path
-from psutil import process_iter
 from threading import Thread
 from queue import Queue
 import warnings
@@ -15,6 +14,7 @@ from modules.gui import GUI
 from modules.log_parser import LogParser
 from modules.sounds import Sounds
 from modules.commander_mode.cm_core import CM_Core
+from modules.process_watcher import ProcessWatcher, LAUNCHER_PROCESS, GAME_PROCESS
 
 class KillTracker():
     """Official Kill Tracker for BWC."""
@@ -32,13 +32,12 @@ class KillTracker():
         self.player_geid = {"current": "N/A"}
         self.active_ship = {"current": "N/A"}
         self.update_queue = Queue()    
+        self.process_watcher = ProcessWatcher([LAUNCHER_PROCESS, GAME_PROCESS])
         
     def check_if_process_running(self, process_name:str) -> str:
         """Check if a process is running by name."""
         try:
-            for proc in process_iter(['name', 'exe']):
-                if process_name.lower() == proc.info['name'].lower():
-                    return proc.info['exe']
+            return self.process_watcher.find(process_name)
         except Exception as e:
             self.log.error(f"check_if_process_running(): Error: {e.__class__.__name__} {e}")
         return ""
@@ -46,7 +45,7 @@ class KillTracker():
     def is_game_running(self) -> bool:
         """Check if Star Citizen is running."""
         try:
-            if self.check_if_process_running("StarCitizen_Launcher.exe"):
+            if self.check_if_process_running(GAME_PROCESS):
                 return True
             return False
         except Exception as e:
@@ -56,14 +55,14 @@ class KillTracker():
         """Check for RSI Launcher and Star Citizen Launcher, and get the log path."""
         try:
             # Check if RSI Launcher is running
-            rsi_launcher_path = self.check_if_process_running("RSI Launcher.exe")
+            rsi_launcher_path = self.check_if_process_running(LAUNCHER_PROCESS)
             if not rsi_launcher_path:
                 self.log.warning("RSI Launcher not running.")
                 return ""
             self.log.debug(f"RSI Launcher running at: {rsi_launcher_path}")
 
             # Check if Star Citizen Launcher is running
-            sc_launcher_path = self.check_if_process_running("StarCitizen_Launcher.exe")
+            sc_launcher_path = self.check_if_process_running(GAME_PROCESS)
             if not sc_launcher_path:
                 self.log.warning("Star Citizen Launcher not running.")
                 return ""
@@ -113,20 +112,20 @@ class KillTracker():
                 if game_running and not self.monitoring["active"]:  # Log only when transitioning to running
                     self.log_parser.log_file_location = self.get_sc_log_location(self.get_sc_processes())
                     self.log.success("Star Citizen is running. Starting kill tracking.")
-                    self.rsi_handle["current"] = self.log_parser.find_rsi_handle()
-                    self.log.success(f"Current RSI handle is {self.rsi_handle['current']}.")
-                    self.player_geid["current"] = self.log_parser.find_rsi_geid()
-                    self.log.debug(f"Current User GEID is {self.player_geid['current']}.")
                     self.monitoring["active"] = True
-                    self.log_parser.start_tail_log_thread()
+                    if not self.log_parser.start_tail_log_thread():
+                        # The old tailer has not exited yet, try again on the next check
+                        self.monitoring["active"] = False
 
                 elif not game_running and self.monitoring["active"]:  # Log only when transitioning to stopped
                     self.log.warning("Star Citizen has stopped.")
                     self.monitoring["active"] = False
+                    self.log_parser.stop_tail_log_thread()
 
             except Exception as e:
                 self.log.error(f"monitor_game_state(): Error: {e.__class__.__name__} {e}")
-            sleep(5)  # Check every 5 seconds
+            # Check every 5 seconds, or right away when the game logs its shutdown
+            self.process_watcher.wait(5)
 
     def auto_shutdown(self, app, delay_in_seconds):
         def shutdown():
@@ -217,10 +216,13 @@ def main():
         try:
             #TODO Make a module import framework to easily add in future modules
             kt.log_parser = log_parser_module
+            log_parser_module.process_watcher = kt.process_watcher
             # Add logger ref to classes
             kt.log = gui_module.log
+            kt.process_watcher.log = gui_module.log
             cfg_module.log = gui_module.log
             api_client_module.log = gui_module.log
+            api_client_module.kill_uploader.log = gui_module.log
             sound_module.log = gui_module.log
             cm_module.log = gui_module.log
             log_parser_module.log = gui_module.log
@@ -231,6 +233,12 @@ def main():
             sound_module.setup_sounds()
         except Exception as e:
             print(f"main(): ERROR in setting up the sounds module: {e.__class__.__name__} {e}")
+
+        try:
+            # Names and ignored victim rules from the last session, before GrimReaperBot is reached
+            api_client_module.load_data_map_cache()
+        except Exception as e:
+            print(f"main(): ERROR loading the cached data maps: {e.__class__.__name__} {e}")
         
         try:
             # Kill Tracker log pickler
@@ -250,9 +258,14 @@ def main():
         gui_module.app.mainloop()
         # Ensure all threads are stopped
         kt.program_state["enabled"] = False
+        # Let the log tailer write its final checkpoint
+        if kt.log_parser:
+            kt.log_parser.stop_tail_log_thread()
     except KeyboardInterrupt:
         print("Program interrupted. Exiting gracefully...")
         kt.monitoring["active"] = False
+        if kt.log_parser:
+            kt.log_parser.stop_tail_log_thread()
         if isinstance(monitor_thr, Thread):
             monitor_thr.join(1)
         gui_module.app.quit()
@@ -6,7 +6,15 @@ import pytz
 from tzlocal import get_localzone
 from packaging import version
 from time import sleep
-import itertools
+import json
+import hashlib
+from typing import Union
+
+# Import kill tracker modules
+from modules.kill_dedup import KillDedup
+from modules.http_transport import HttpTransport
+from modules.kill_uploader import KillUploader
+from modules.data_map_cache import DataMapCache
 
 # ERROR CODES:
 ERRORCODE_Void = 469
@@ -14,9 +22,26 @@ ERRORCODE_Expired = 470
 ERRORCODE_Revoked = 471
 ERRORCODE_Banned = 472
 
+# Responses of a server that does not know the batch endpoint yet
+BATCH_UNAVAILABLE_CODES = (404, 405, 501)
+
+def data_map_entries(data) -> dict:
+    """Entries of a data map (a dict, or a list of mappings and rules) keyed by their canonical JSON."""
+    if isinstance(data, dict):
+        data = data.items()
+    return {json.dumps(entry, sort_keys=True): entry for entry in data}
+
+def diff_data_maps(old_data, new_data) -> tuple:
+    """Entries (added, removed) between two versions of a data map, compared as hashed sets."""
+    old_entries = data_map_entries(old_data)
+    new_entries = data_map_entries(new_data)
+    added = [new_entries[key] for key in new_entries.keys() - old_entries.keys()]
+    removed = [old_entries[key] for key in old_entries.keys() - new_entries.keys()]
+    return added, removed
+
 class API_Client():
     """API client for the Kill Tracker."""
-    def __init__(self, cfg_handler, gui, monitoring, local_version, discord_id, rsi_handle):
+    def __init__(self, cfg_handler, gui, monitoring, local_version, discord_id, rsi_handle, transport=None):
         self.log = None
         self.cm = None
         self.cfg_handler = cfg_handler
@@ -28,7 +53,15 @@ class API_Client():
         self.request_timeout = 12
         self.api_key = {"value": None}
         self.api_fqdn = "http://78.108.218.209:25219"
+        self.transport = transport if transport else HttpTransport(self.api_fqdn, self.api_key, f"Killtracker/{self.local_version}", self.request_timeout)
         self.sc_data = {"weapons": [], "zones": [], "vehicles": [], "gameModes": [], "ignoredVictimRules": []}
+        self.data_map_listeners = {}
+        # Validators of the last data map downloads: ETag from the server and a hash of the body
+        self.data_map_etags = {}
+        self.data_map_hashes = {}
+        self.data_map_cache = DataMapCache()
+        self.posted_kills = KillDedup()
+        self.kill_uploader = KillUploader(self)
         self.expiration_time = None
         self.countdown_active = False
         self.connection_healthy = False
@@ -84,22 +117,12 @@ class API_Client():
     def validate_api_key(self, key) -> bool:
         """Validate the API key."""
         try:
-            url = f"{self.api_fqdn}/validateKey"
-            headers = {
-                "Authorization": key,
-                "Content-Type": "application/json"
-            }
             api_key_data = {
                 "api_key": key,
                 "player_name": self.rsi_handle["current"]
             }
             self.log.debug(f"validate_api_key(): Request payload: {api_key_data}")
-            response = requests.post(
-                url, 
-                headers=headers, 
-                json=api_key_data, 
-                timeout=self.request_timeout
-            )
+            response = self.transport.post("validateKey", json=api_key_data, key=key)
             self.log.debug(f"validate_api_key(): Response text: {response.text}")
             if response.status_code != 200:
                 if response.status_code == ERRORCODE_Banned:
@@ -167,22 +190,12 @@ class API_Client():
     def post_api_key_expiration_time(self):
         """Retrieve the expiration time for the API key from the validation server."""
         try:
-            url = f"{self.api_fqdn}/get_expiration"
-            headers = {
-                "Authorization": self.api_key["value"],
-                "Content-Type": "application/json"
-            }
             api_key_exp_time = {
                 "api_key": self.api_key["value"],
                 "player_name": self.rsi_handle["current"]
             }
             self.log.debug(f"post_api_key_expiration_time(): Request payload: {api_key_exp_time}")
-            response = requests.post(
-                url, 
-                headers=headers, 
-                json=api_key_exp_time, 
-                timeout=self.request_timeout
-            )
+            response = self.transport.post("get_expiration", json=api_key_exp_time)
             self.log.debug(f"post_api_key_expiration_time(): Response text: {response.text}")
             if response.status_code == 200:
                 self.connection_healthy = True
@@ -286,10 +299,10 @@ class API_Client():
                         self.log.debug("Pulling SC data mappings from GrimReaperBot.")
                         self.get_data_map("weapons")
                         sleep(1)
-                        #self.get_data_map("zones")
-                        #sleep(1)
-                        #self.get_data_map("vehicles")
-                        #sleep(1)
+                        self.get_data_map("zones")
+                        sleep(1)
+                        self.get_data_map("vehicles")
+                        sleep(1)
                         #self.get_data_map("gameModes")
                         #sleep(1)
                         self.get_data_map("ignoredVictimRules")
@@ -314,28 +327,35 @@ class API_Client():
                 self.log.warning("Error: Data map for {} will not be pulled because the key does not exist. Using default mappings.")
                 return
             
-            url = f"{self.api_fqdn}/data_map/{data_type}"
-            headers = {
-                'Authorization': self.api_key["value"] if self.api_key["value"] else ""
-            }
             self.log.debug(f"get_data_map(): Requesting data for {data_type} from GrimReaperBot.")
-            response = requests.get(
-                url, 
-                headers=headers, 
-                timeout=self.request_timeout
-            )
-            if response.status_code == 200:
+            headers = {}
+            if data_type in self.data_map_etags:
+                headers["If-None-Match"] = self.data_map_etags[data_type]
+            response = self.transport.get(f"data_map/{data_type}", headers=headers)
+            if response.status_code == 304:
+                self.connection_healthy = True
+                self.log.debug(f"get_data_map(): Local SC data for {data_type} is the same as GrimReaperBot (not modified).")
+            elif response.status_code == 200:
                 self.connection_healthy = True
                 self.log.debug(f'{data_type} data mappings has been downloaded from GrimReaperBot.')
-                # Merge incoming SC data into new dict
+                # Servers without ETags send the same body again, skip parsing it
+                content_hash = hashlib.sha256(response.content).hexdigest()
+                if self.data_map_hashes.get(data_type) == content_hash:
+                    self.log.debug(f"get_data_map(): Local SC data for {data_type} is the same as GrimReaperBot.")
+                    return
                 server_data = response.json()[data_type]
-                diff = list(itertools.filterfalse(lambda x: x in self.sc_data[data_type], server_data)) + list(itertools.filterfalse(lambda x: x in server_data, self.sc_data[data_type]))
-                if len(diff) > 0:
+                added, removed = diff_data_maps(self.sc_data[data_type], server_data)
+                self.data_map_hashes[data_type] = content_hash
+                if response.headers.get("ETag"):
+                    self.data_map_etags[data_type] = response.headers["ETag"]
+                if added or removed:
                     self.log.debug(f"get_data_map(): Local SC data for the Kill Tracker differs from GrimReaperBot data. Updating local data for {data_type}")
-                    self.log.debug(f'get_data_map(): Diff for {data_type} data: {diff}')
+                    self.log.debug(f'get_data_map(): Diff for {data_type} data: {len(added)} added {added[:20]}, {len(removed)} removed {removed[:20]}')
                     self.sc_data[data_type] = server_data
+                    self.notify_data_map_listeners(data_type)
                 else:
                     self.log.debug(f"get_data_map(): Local SC data for {data_type} is the same as GrimReaperBot.")
+                self.data_map_cache.save(self.sc_data, self.data_map_etags, self.data_map_hashes)
             else:
                 self.log.error(f"{response.status_code} Error when pulling data for {data_type}.")
                 self.connection_healthy = False
@@ -346,6 +366,36 @@ class API_Client():
             self.log.error(f"get_data_map(): Error: {e.__class__.__name__} {e}")
             self.connection_healthy = False
 
+    def load_data_map_cache(self) -> None:
+        """Start from the data maps saved by the last session, the key countdown refreshes them in the background."""
+        self.data_map_cache.log = self.log
+        cached_maps = self.data_map_cache.load()
+        if not cached_maps:
+            self.log.debug("load_data_map_cache(): No cached SC data, waiting for GrimReaperBot.")
+            return
+        for data_type, cached_map in cached_maps.items():
+            if data_type not in self.sc_data:
+                continue
+            self.sc_data[data_type] = cached_map["data"]
+            if cached_map.get("etag"):
+                self.data_map_etags[data_type] = cached_map["etag"]
+            if cached_map.get("hash"):
+                self.data_map_hashes[data_type] = cached_map["hash"]
+            self.notify_data_map_listeners(data_type)
+        self.log.debug(f"load_data_map_cache(): Loaded cached SC data for {', '.join(cached_maps)}.")
+
+    def add_data_map_listener(self, data_type:str, callback) -> None:
+        """Register a callback to receive a data map whenever its contents change."""
+        self.data_map_listeners.setdefault(data_type, []).append(callback)
+
+    def notify_data_map_listeners(self, data_type:str) -> None:
+        """Hand an updated data map to everything built from it."""
+        for callback in self.data_map_listeners.get(data_type, []):
+            try:
+                callback(self.sc_data[data_type])
+            except Exception as e:
+                self.log.error(f"notify_data_map_listeners(): Error rebuilding from {data_type}: {e.__class__.__name__} {e}")
+
     def post_kill_event(self, kill_result: dict) -> bool:
         """Post the kill/death event parsed from the log."""
         try:
@@ -353,21 +403,21 @@ class API_Client():
                 self.log.error("Error: kill event will not be sent because the key does not exist. Please enter a valid Kill Tracker key to establish connection with GrimReaperBot...")
                 return
             
-            url = f"{self.api_fqdn}/reportKill"
-            headers = {
-                'content-type': 'application/json',
-                'Authorization': self.api_key["value"] if self.api_key["value"] else ""
-            }
+            fingerprint = KillDedup.fingerprint(kill_result)
+            if fingerprint in self.posted_kills:
+                self.log.debug(f"post_kill_event(): Kill was already posted, skipping: {kill_result}")
+                return True
+
             self.log.debug(f"post_kill_event(): Request payload: {kill_result}")
-            response = requests.post(
-                url, 
-                headers=headers, 
-                json=kill_result, 
-                timeout=self.request_timeout
+            response = self.transport.post(
+                "reportKill",
+                json=kill_result,
+                headers={"Idempotency-Key": KillDedup.idempotency_key(kill_result)}
             )
             self.log.debug(f"post_kill_event(): Response text: {response.text}")
             if response.status_code == 200:
                 self.connection_healthy = True
+                self.posted_kills.add(fingerprint)
                 self.log.debug(f'Successfully posted post_kill_event to GrimReaperBot: {kill_result}')
                 return True
             else:
@@ -380,8 +430,45 @@ class API_Client():
         # Failure state
         self.log.error(f"Error: kill event {kill_result} will not be sent!")
         self.connection_healthy = False
-        pickle_payload = {"kill_result": kill_result, "endpoint": "reportKill"}
-        if pickle_payload not in self.cfg_handler.cfg_dict["pickle"]:
-            self.cfg_handler.cfg_dict["pickle"].append(pickle_payload)
-            self.log.warning(f'Connection seems to be unhealthy. Pickling kill.')
+        self.pickle_kill_event(kill_result)
         return False
+
+    def post_kill_batch(self, kill_results: list) -> Union[bool, None]:
+        """Post several kills in one request, each tagged with its idempotency key.
+        Returns None if GrimReaperBot has no batch endpoint, the caller then posts them one by one."""
+        try:
+            if not self.api_key["value"]:
+                self.log.error("Error: kill events will not be sent because the key does not exist. Please enter a valid Kill Tracker key to establish connection with GrimReaperBot...")
+                return False
+            kill_batch = {"kills": [dict(kill_result, idempotency_key=KillDedup.idempotency_key(kill_result)) for kill_result in kill_results]}
+            self.log.debug(f"post_kill_batch(): Request payload: {kill_batch}")
+            response = self.transport.post("reportKills", json=kill_batch)
+            self.log.debug(f"post_kill_batch(): Response text: {response.text}")
+            if response.status_code in BATCH_UNAVAILABLE_CODES:
+                return None
+            if response.status_code == 200:
+                self.connection_healthy = True
+                for kill_result in kill_results:
+                    self.posted_kills.add(KillDedup.fingerprint(kill_result))
+                self.log.debug(f'Successfully posted {len(kill_results)} kills to GrimReaperBot.')
+                return True
+            self.log.error(f"Error when posting {len(kill_results)} kills: code {response.status_code}")
+        except requests.exceptions.RequestException as e:
+            self.gui.async_loading_animation()
+            self.log.error(f"HTTP Error sending kill events: {e}")
+        except Exception as e:
+            self.log.error(f"post_kill_batch(): Error: {e.__class__.__name__} {e}")
+        self.connection_healthy = False
+        return False
+
+    def store_kill_event(self, kill_result: dict) -> None:
+        """Keep an accepted kill in the outbox until the kill uploader has posted it."""
+        self.kill_uploader.store(kill_result)
+
+    def pickle_kill_event(self, kill_result: dict) -> None:
+        """Buffer a kill that could not be posted, the log pickler retries it later."""
+        try:
+            if self.cfg_handler.outbox.enqueue(kill_result):
+                self.log.warning(f'Connection seems to be unhealthy. Pickling kill.')
+        except Exception as e:
+            self.log.error(f"pickle_kill_event(): Error: kill {kill_result} could not be buffered: {e.__class__.__name__} {e}")
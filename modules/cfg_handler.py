@@ -4,6 +4,10 @@ import json
 from time import sleep
 from pathlib import Path
 
+# Import kill tracker modules
+from modules.error_reporter import ErrorReporter
+from modules.kill_outbox import KillOutbox
+
 class Cfg_Handler:
     """Config Handler with simple XOR encryption (built-in only)."""
 
@@ -13,9 +17,16 @@ class Cfg_Handler:
         self.program_state = program_state
         self.old_cfg_path = Path.cwd() / "killtracker_key.cfg"
         self.cfg_path = Path.cwd() / "bwc_killtracker.cfg"
-        self.cfg_dict = {"key": "", "overlay": False, "ping": False, "volume": {"level": 0.5, "is_muted": False}, "pickle": []}
+        self.cfg_dict = {"key": "", "overlay": False, "ping": False, "volume": {"level": 0.5, "is_muted": False}}
         self.rsi_handle = rsi_handle if rsi_handle else "default_handle"
         self.key = self._derive_key(self.rsi_handle)
+        # Kills waiting for upload live in their own store, config saves stay the same size however many there are
+        self.outbox = KillOutbox()
+        self.outbox_batch = 100
+        # Kills younger than this are still with the kill uploader, the pickler retries the ones it left behind
+        self.outbox_grace = 60
+        # The kill buffer is retried every minute, up to every 10 minutes while it keeps failing
+        self.pickler_errors = ErrorReporter("log_pickler", window=600, base_delay=60, max_delay=600)
 
     def _derive_key(self, rsi_handle: str) -> bytes:
         """Derive a 32-byte key from the RSI handle using SHA256."""
@@ -72,31 +83,46 @@ class Cfg_Handler:
             else:
                 print(f"Was not able to save the config to {str(self.cfg_path)} - {e}.")
 
+    def migrate_pickle(self) -> None:
+        """Move kills buffered in the config by older versions into the outbox."""
+        pickle_payloads = self.cfg_dict.pop("pickle", None)
+        if not pickle_payloads:
+            return
+        for pickle_payload in pickle_payloads:
+            self.outbox.enqueue(pickle_payload["kill_result"], pickle_payload.get("endpoint", "reportKill"))
+        if self.log:
+            self.log.info(f"Moved {len(pickle_payloads)} buffered kills from the config to the kill outbox.")
+        # Rewrite the config without the pickle list
+        self.save_cfg("key", self.cfg_dict.get("key", ""))
+
     def log_pickler(self) -> None:
-        """Pickle and unpickle kill logs."""
+        """Upload the kills waiting in the outbox."""
+        self.pickler_errors.log = self.log
+        self.outbox.log = self.log
         while self.program_state["enabled"]:
             try:
-                if len(self.cfg_dict["pickle"]) > 0:
+                if "pickle" in self.cfg_dict:
+                    self.migrate_pickle()
+                if self.outbox.depth > 0:
                     if self.log:
-                        self.log.debug(f'Current buffer: {self.cfg_dict["pickle"]}.')
-                    self.save_cfg("pickle", self.cfg_dict["pickle"])
+                        self.log.debug(f"Kill outbox: {self.outbox.depth} kills, oldest waiting {self.outbox.oldest_age():.0f}s.")
                     if self.api and getattr(self.api, "connection_healthy", False):
-                        pickle_payload = self.cfg_dict["pickle"][0]
                         if self.log:
-                            self.log.info(f'Attempting to post a previous kill from the buffer: {pickle_payload["kill_result"]}')
-                        uploaded = self.api.post_kill_event(pickle_payload["kill_result"])
-                        if uploaded:
-                            self.cfg_dict["pickle"].pop(0)
-                            self.save_cfg("pickle", self.cfg_dict["pickle"])
+                            self.log.info(f"Attempting to post {self.outbox.depth} previous kills from the buffer.")
+                        # Drain the whole outbox in batches, stopping at the first failure
+                        while self.program_state["enabled"]:
+                            entries = self.outbox.peek(self.outbox_batch, self.outbox_grace)
+                            if not entries:
+                                break
+                            uploaded = self.api.kill_uploader.upload([kill_result for _, kill_result in entries])
+                            self.outbox.ack([entry_id for (entry_id, _), ok in zip(entries, uploaded) if ok])
+                            if not all(uploaded):
+                                break
+                self.pickler_errors.success()
             except Exception as e:
-                if self.log:
-                    self.log.error(f"log_pickler(): Error: {e.__class__.__name__} {e}")
-                else:
-                    print(f"log_pickler(): Error: {e.__class__.__name__} {e}")
-            for sec in range(60):
+                self.pickler_errors.report(f"log_pickler(): Error: {e.__class__.__name__} {e}")
+            for sec in range(int(self.pickler_errors.backoff or 60)):
                 if not self.program_state["enabled"]:
-                    if self.log:
-                        self.log.info("Executing final config save.")
-                    self.save_cfg("pickle", self.cfg_dict["pickle"])
                     break
                 sleep(1)
+        self.pickler_errors.close()
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import modules.helpers as Helpers
+
+class Checkpoint():
+    """Small JSON file remembering how far into Game.log we got and the session state at that point,
+    so a restarted tracker picks up where it left off instead of replaying the log."""
+    VERSION = 2
+
+    def __init__(self, file_path=None):
+        self.log = None
+        self.file_path = Path(file_path) if file_path else Path.cwd() / "bwc_killtracker.checkpoint"
+
+    def load(self) -> dict:
+        """The saved checkpoint, or None if there is none or it can't be read."""
+        try:
+            return Helpers.read_versioned_json(self.file_path, self.VERSION)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self.log:
+                self.log.warning(f"Checkpoint.load(): Ignoring unreadable checkpoint: {e.__class__.__name__} {e}")
+            return None
+
+    def save(self, state:dict) -> None:
+        """Save the checkpoint."""
+        try:
+            Helpers.write_versioned_json(self.file_path, self.VERSION, state)
+        except Exception as e:
+            if self.log:
+                self.log.error(f"Checkpoint.save(): Error: {e.__class__.__name__} {e}")
+
+    def matches(self, state:dict, identity:dict, size:int) -> bool:
+        """Whether a channel's saved state belongs to this log file and still points inside it."""
+        return (
+            state is not None and
+            state.get("dev") == identity["dev"] and
+            state.get("ino") == identity["ino"] and
+            state.get("head") == identity["head"] and
+            0 <= state.get("offset", -1) <= size
+        )
@@ -1,7 +1,6 @@
 from typing import Union
 
 import requests
-from time import sleep
 
 class CM_API_Client():
     """Commander Mode API module for the Kill Tracker."""
@@ -16,7 +15,6 @@ class CM_API_Client():
                 self.log.debug("Error: Heartbeat is not active. Death event will not be sent.")
                 return
 
-            url = f"{self.api_fqdn}/validateKey" # API endpoint is setup to receive heartbeats
             status = "alive" if self.active_ship["current"] != "N/A" else "dead"
             heartbeat_event = {
                 'is_heartbeat': True,
@@ -37,17 +35,9 @@ class CM_API_Client():
                 heartbeat_event['zone'] = player_ship
                 heartbeat_event['status'] = "alive"
             # If it's not either of the above if/else statements, its probably a flag update!
-            headers = {
-                'content-type': 'application/json',
-                'Authorization': self.api_key["value"] if self.api_key["value"] else ""
-            }
             self.log.debug(f"post_heartbeat_event(): Request payload: {heartbeat_event}")
-            response = requests.post(
-                url,
-                headers=headers,
-                json=heartbeat_event,
-                timeout=self.request_timeout
-            )
+            # API endpoint is setup to receive heartbeats
+            response = self.transport.post("validateKey", json=heartbeat_event)
             self.log.debug(f"post_heartbeat_event(): Response text: {response.text}")
             if response.status_code != 200:
                 self.log.error(f"Error in posting event: code {response.status_code}")
@@ -60,16 +50,20 @@ class CM_API_Client():
 
     def post_heartbeat(self) -> None:
         """Sends a heartbeat to the server every interval and updates the UI with active commanders."""        
+        # Keep this run's stop event and reporter, a reconnect replaces them for the next heartbeat thread
+        stop = self.heartbeat_stop
+        errors = self.heartbeat_errors
+        errors.log = self.log
         while self.heartbeat_status["active"]:
             try:
-                sleep(self.heartbeat_interval)
+                if stop.wait(self.heartbeat_interval):
+                    break
                 if not self.api_key["value"]:
                     self.log.warning("Error: heartbeat will not be sent because the key does not exist.")
                     # Call disconnect commander and exit
                     self.toggle_commander()
                     break
                 
-                url = f"{self.api_fqdn}/validateKey"
                 # Determine status based on the active ship
                 status = "alive" if self.active_ship["current"] != "N/A" else "dead"
                 heartbeart_base = {
@@ -83,17 +77,8 @@ class CM_API_Client():
                 }
                 if self.is_commander is True:
                     heartbeart_base['alloc_users'] = self.alloc_users if self.alloc_users else None
-                headers = {
-                    'content-type': 'application/json',
-                    'Authorization': self.api_key["value"] if self.api_key["value"] else ""
-                }
                 #self.log.debug(f"post_heartbeat(): Request payload: {heartbeart_base}")
-                response = requests.post(
-                    url, 
-                    headers=headers, 
-                    json=heartbeart_base, 
-                    timeout=self.request_timeout
-                )
+                response = self.transport.post("validateKey", json=heartbeart_base)
                 self.log.debug(f"post_heartbeat(): Response text: {response.text}")
                 response.raise_for_status()  # Raises an exception for HTTP errors
                 response_data = response.json()
@@ -104,7 +89,10 @@ class CM_API_Client():
                     self.update_queue.put(active_commanders)
                 else:
                     self.log.debug("No commanders found in response.")
+                errors.success()
             except requests.RequestException as e:
-                self.log.error(f"HTTP Error when sending heartbeat: {e}")
+                # Wait longer between heartbeats while the server keeps failing
+                stop.wait(errors.report(f"HTTP Error when sending heartbeat: {e}"))
             except Exception as e:
-                self.log.error(f"post_heartbeat(): Error: {e.__class__.__name__} {e}")
+                stop.wait(errors.report(f"post_heartbeat(): Error: {e.__class__.__name__} {e}"))
+        errors.close()
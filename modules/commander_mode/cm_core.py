@@ -1,8 +1,9 @@
-from threading import Thread
+from threading import Thread, Event
 from time import sleep
 # Inherit sub-modules
 from modules.commander_mode.cm_api import CM_API_Client
 from modules.commander_mode.cm_gui import CM_GUI
+from modules.error_reporter import ErrorReporter
 
 class CM_Core(CM_API_Client, CM_GUI):
     """Commander Mode core module for the Kill Tracker."""
@@ -12,6 +13,7 @@ class CM_Core(CM_API_Client, CM_GUI):
         self.api_key = api_module.api_key
         self.api_fqdn = api_module.api_fqdn
         self.request_timeout = api_module.request_timeout
+        self.transport = api_module.transport
         self.monitoring = monitoring
         self.heartbeat_status = heartbeat_status
         self.rsi_handle = rsi_handle
@@ -27,6 +29,8 @@ class CM_Core(CM_API_Client, CM_GUI):
         self.connect_commander_button = None
         self.join_timeout = 10
         self.heartbeat_interval = 5
+        self.heartbeat_stop = Event()
+        self.heartbeat_errors = ErrorReporter("post_heartbeat", base_delay=self.heartbeat_interval, max_delay=60)
 
         # Battle Tracking info
         self.is_commander = False
@@ -166,6 +170,9 @@ class CM_Core(CM_API_Client, CM_GUI):
         try:
             if not self.heartbeat_daemon and not self.cm_update_daemon:
                 self.log.info("Connecting to Commander...")
+                # Start with no back off left over from the last connection
+                self.heartbeat_stop = Event()
+                self.heartbeat_errors = ErrorReporter("post_heartbeat", base_delay=self.heartbeat_interval, max_delay=60)
                 self.heartbeat_daemon = Thread(target=self.post_heartbeat, daemon=True)
                 self.heartbeat_daemon.start()
                 self.log.debug(f"start_heartbeat_threads(): Started heartbeat thread.")
@@ -185,6 +192,7 @@ class CM_Core(CM_API_Client, CM_GUI):
             ):
                 self.log.info("Commander is shutting down...")
                 self.heartbeat_status["active"] = False
+                self.heartbeat_stop.set()
                 self.clear_listboxes()
                 self.heartbeat_daemon = None
                 self.log.debug(f"stop_heartbeat_threads(): Stopped heartbeat thread.")
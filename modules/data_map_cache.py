@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import modules.helpers as Helpers
+
+class DataMapCache():
+    """The last data maps downloaded from GrimReaperBot, kept on disk so weapon, zone and vehicle names
+    and the ignored victim rules work from the first log line of a session, before the server is reached.
+    The ETag and body hash of every map are kept with it, so the first refresh can be a 304."""
+    VERSION = 1
+
+    def __init__(self, file_path=None):
+        self.log = None
+        self.file_path = Path(file_path) if file_path else Path.cwd() / "bwc_killtracker.datamaps"
+
+    def load(self) -> dict:
+        """{data type: {"data", "etag", "hash"}} of the cached maps, or None if there is no usable cache."""
+        try:
+            cache = Helpers.read_versioned_json(self.file_path, self.VERSION)
+            return cache["maps"] if cache else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self.log:
+                self.log.warning(f"DataMapCache.load(): Ignoring unreadable data map cache: {e.__class__.__name__} {e}")
+            return None
+
+    def save(self, sc_data:dict, etags:dict, hashes:dict) -> None:
+        """Save the maps with their ETags and body hashes."""
+        maps = {
+            data_type: {"data": data, "etag": etags.get(data_type), "hash": hashes.get(data_type)}
+            for data_type, data in sc_data.items() if data
+        }
+        try:
+            Helpers.write_versioned_json(self.file_path, self.VERSION, {"maps": maps})
+        except Exception as e:
+            if self.log:
+                self.log.error(f"DataMapCache.save(): Error: {e.__class__.__name__} {e}")
@@ -0,0 +1,83 @@
+from threading import Lock
+from time import monotonic
+
+class ErrorReporter():
+    """Error reporting for one long running loop (log tailer, heartbeat, kill buffer).
+    The first occurrence of an error is logged right away, repeats of the same message within window
+    seconds are only counted and logged as one summary line ("x1200 in last 10s").
+    Consecutive failures grow the loop's back off delay exponentially, a successful pass resets it."""
+    def __init__(self, name:str, window:float=10, base_delay:float=1, max_delay:float=60):
+        self.log = None
+        self.name = name
+        self.window = window
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lock = Lock()
+        # message -> [first seen, repeats not logged yet]
+        self.recent = {}
+        self.failures = 0
+        self.errors = 0
+        self.suppressed = 0
+        self.last_error = None
+
+    @property
+    def backoff(self) -> float:
+        """Seconds the loop should wait before its next pass, 0 while it is healthy."""
+        if not self.failures:
+            return 0
+        return min(self.base_delay * 2 ** (self.failures - 1), self.max_delay)
+
+    def _emit(self, message:str) -> None:
+        if self.log:
+            self.log.error(message)
+        else:
+            print(message)
+
+    def _flush(self, now:float, force:bool=False) -> None:
+        """Log a summary for every message whose window ran out and forget it."""
+        for message, (first_seen, repeats) in list(self.recent.items()):
+            elapsed = now - first_seen
+            if not force and elapsed < self.window:
+                continue
+            del self.recent[message]
+            if repeats:
+                self._emit(f"{message} (x{repeats} in last {elapsed:.0f}s)")
+
+    def report(self, message:str) -> float:
+        """Count a failure of the loop and log it unless it is a repeat. Returns the back off delay in seconds."""
+        with self.lock:
+            now = monotonic()
+            self.errors += 1
+            self.failures += 1
+            self.last_error = message
+            self._flush(now)
+            entry = self.recent.get(message)
+            if entry is None:
+                self.recent[message] = [now, 0]
+                self._emit(message)
+            else:
+                entry[1] += 1
+                self.suppressed += 1
+            return self.backoff
+
+    def success(self) -> None:
+        """The loop made a pass without failing, reset the back off."""
+        if not self.failures and not self.recent:
+            return
+        with self.lock:
+            self.failures = 0
+            self._flush(monotonic())
+
+    def close(self) -> None:
+        """Log the summaries still pending, for when the loop exits."""
+        with self.lock:
+            self._flush(monotonic(), force=True)
+
+    def stats(self) -> dict:
+        return {
+            "errors": self.errors,
+            "suppressed": self.suppressed,
+            "failures": self.failures,
+            "backoff": self.backoff,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,140 @@
+from queue import Queue, Full, Empty
+from threading import Thread, Lock
+from time import monotonic
+
+class KillEvent():
+    """A parsed kill or death of the player, as produced by the log tailer."""
+    __slots__ = ("kill_result", "curr_killstreak", "max_killstreak", "kill_total", "death_total")
+
+    def __init__(self, kill_result:dict, curr_killstreak:int, max_killstreak:int, kill_total:int, death_total:int):
+        self.kill_result = kill_result
+        self.curr_killstreak = curr_killstreak
+        self.max_killstreak = max_killstreak
+        self.kill_total = kill_total
+        self.death_total = death_total
+
+    @property
+    def result(self) -> str:
+        return self.kill_result["result"]
+
+class VehicleEvent():
+    """The player's vehicle status changed."""
+    __slots__ = ("status",)
+
+    def __init__(self, status:str):
+        self.status = status
+
+class PipelineSink():
+    """A bounded queue of events drained by its own worker thread."""
+    def __init__(self, name:str, handler, event_types:tuple, maxsize:int, block_timeout:float, on_overflow=None, on_error=None):
+        self.name = name
+        self.handler = handler
+        self.event_types = event_types
+        self.queue = Queue(maxsize=maxsize)
+        self.block_timeout = block_timeout
+        self.on_overflow = on_overflow
+        self.on_error = on_error
+        self.thread = None
+        self.stats_lock = Lock()
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.high_water = 0
+        self.blocked_seconds = 0.0
+
+    def put(self, event) -> bool:
+        """Queue an event. A full queue blocks the producer for at most block_timeout, then the event overflows."""
+        start = monotonic()
+        try:
+            if self.block_timeout:
+                self.queue.put(event, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(event)
+        except Full:
+            with self.stats_lock:
+                self.dropped += 1
+                self.blocked_seconds += monotonic() - start
+            if self.on_overflow:
+                self.on_overflow(event)
+            return False
+        with self.stats_lock:
+            self.enqueued += 1
+            self.blocked_seconds += monotonic() - start
+            self.high_water = max(self.high_water, self.queue.qsize())
+        return True
+
+    def run(self, running) -> None:
+        while running():
+            try:
+                event = self.queue.get(timeout=1)
+            except Empty:
+                continue
+            try:
+                self.handler(event)
+            except Exception as e:
+                with self.stats_lock:
+                    self.errors += 1
+                if self.on_error:
+                    self.on_error(self.name, e)
+            with self.stats_lock:
+                self.processed += 1
+
+    def stats(self) -> dict:
+        with self.stats_lock:
+            return {
+                "depth": self.queue.qsize(),
+                "high_water": self.high_water,
+                "enqueued": self.enqueued,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "blocked_seconds": round(self.blocked_seconds, 3),
+            }
+
+class EventPipeline():
+    """Fans events out from the log tailer to independent sinks so slow consumers never stall log reading."""
+    def __init__(self):
+        self.log = None
+        self.sinks = []
+        self.running = False
+
+    def add_sink(self, name:str, handler, event_types:tuple, maxsize:int, block_timeout:float=0, on_overflow=None) -> PipelineSink:
+        sink = PipelineSink(name, handler, event_types, maxsize, block_timeout, on_overflow, self.report_error)
+        self.sinks.append(sink)
+        if self.running:
+            self._start_sink(sink)
+        return sink
+
+    def start(self) -> None:
+        """Start a worker per sink, calling this again is a no-op."""
+        if self.running:
+            return
+        self.running = True
+        for sink in self.sinks:
+            self._start_sink(sink)
+
+    def _start_sink(self, sink:PipelineSink) -> None:
+        sink.thread = Thread(target=sink.run, args=(lambda: self.running,), name=f"pipeline-{sink.name}", daemon=True)
+        sink.thread.start()
+
+    def stop(self, timeout:float=2) -> None:
+        self.running = False
+        for sink in self.sinks:
+            if sink.thread:
+                sink.thread.join(timeout)
+                sink.thread = None
+
+    def report_error(self, sink_name:str, e:Exception) -> None:
+        if self.log:
+            self.log.error(f"EventPipeline {sink_name} sink: Error: {e.__class__.__name__} {e}")
+
+    def publish(self, event) -> None:
+        """Hand an event to every sink that takes its type."""
+        for sink in self.sinks:
+            if isinstance(event, sink.event_types):
+                sink.put(event)
+
+    def stats(self) -> dict:
+        """Backpressure metrics per sink."""
+        return {sink.name: sink.stats() for sink in self.sinks}
@@ -1,4 +1,6 @@
-from os import path
+import json
+from os import path, replace
+from pathlib import Path
 import sys
 
 def resource_path(relative_path:str) -> str:
@@ -13,3 +15,16 @@ def resource_path(relative_path:str) -> str:
         return path.join(base_path, relative_path)
     except Exception:
         return relative_path
+
+def read_versioned_json(file_path:Path, version:int) -> dict:
+    """The JSON object saved by write_versioned_json(), or None if another version wrote it. Raises if the file is missing or unreadable."""
+    with open(str(file_path), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if data.get("version") == version else None
+
+def write_versioned_json(file_path:Path, version:int, data:dict) -> None:
+    """Write data tagged with its version through a temp file, so a crash mid-write never leaves a torn file behind."""
+    tmp_path = Path(file_path).with_name(Path(file_path).name + ".tmp")
+    with open(str(tmp_path), "w", encoding="utf-8") as f:
+        json.dump({"version": version, **data}, f, separators=(",", ":"))
+    replace(str(tmp_path), str(file_path))
@@ -0,0 +1,53 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) timeouts in seconds per GrimReaperBot endpoint, the first path segment of the url
+ENDPOINT_TIMEOUTS = {
+    "validateKey": (5, 12),
+    "get_expiration": (5, 12),
+    "data_map": (5, 30),
+    "reportKill": (5, 12),
+    "reportKills": (5, 30),
+}
+
+class HttpTransport():
+    """One keep-alive connection pool to GrimReaperBot shared by the API and Commander Mode clients.
+    Sends the default headers with every request and adds the current key as Authorization."""
+    def __init__(self, base_url:str, api_key:dict, user_agent:str, default_timeout:float=12, pool_size:int=8):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.default_timeout = default_timeout
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        self.session = requests.Session()
+        # Every background thread (uploader, heartbeat, key countdown, kill buffer) can hold its own connection
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+
+    def timeout(self, endpoint:str):
+        return self.timeouts.get(endpoint.split("/", 1)[0], self.default_timeout)
+
+    def request(self, method:str, endpoint:str, key:str=None, timeout=None, **kwargs) -> requests.Response:
+        """Send a request to an endpoint like "reportKill" or "data_map/weapons".
+        key overrides the active key, for validating one that is not active yet."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.setdefault("Authorization", key if key is not None else (self.api_key["value"] or ""))
+        return self.session.request(
+            method,
+            f"{self.base_url}/{endpoint}",
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout(endpoint),
+            **kwargs
+        )
+
+    def get(self, endpoint:str, **kwargs) -> requests.Response:
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint:str, json=None, headers:dict=None, **kwargs) -> requests.Response:
+        headers = dict(headers or {})
+        headers.setdefault("content-type", "application/json")
+        return self.request("POST", endpoint, json=json, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,53 @@
+# Import kill tracker modules
+from modules.line_classifier import EVENT_IDENTITY
+from modules.log_record import LogRecord
+
+class IdentityScanner():
+    """Picks the player's RSI handle and GEID out of Game.log lines as they stream past."""
+    HANDLE_MARKER = "<Legacy login response> [CIG-net] User Login Success"
+    GEID_MARKER = "AccountLoginCharacterStatus_Character"
+
+    def __init__(self, rsi_handle, player_geid, on_found):
+        self.rsi_handle = rsi_handle
+        self.player_geid = player_geid
+        self.on_found = on_found
+        self.handle_found = False
+        self.geid_found = False
+
+    @property
+    def complete(self) -> bool:
+        return self.handle_found and self.geid_found
+
+    @property
+    def markers(self) -> list:
+        """(marker, event type) pairs for the identity lines that have not been seen yet."""
+        markers = []
+        if not self.handle_found:
+            markers.append((self.HANDLE_MARKER, EVENT_IDENTITY))
+        if not self.geid_found:
+            markers.append((self.GEID_MARKER, EVENT_IDENTITY))
+        return markers
+
+    def feed(self, line:str) -> bool:
+        """Check a log line for identity info. Returns True if the line was an identity line."""
+        if not self.handle_found and self.HANDLE_MARKER in line:
+            handle = self.parse_handle(line)
+            if handle:
+                self.handle_found = True
+                self.rsi_handle["current"] = handle
+                self.on_found("rsi_handle", handle)
+            return True
+        if not self.geid_found and self.GEID_MARKER in line:
+            self.geid_found = True
+            self.player_geid["current"] = LogRecord(line).geid
+            self.on_found("player_geid", self.player_geid["current"])
+            return True
+        return False
+
+    def parse_handle(self, line:str) -> str:
+        """Get the handle out of a login line ("... Handle[<name>] ...")."""
+        line_index = line.find("Handle[")
+        if line_index == -1:
+            return ""
+        potential_handle = line[line_index + len("Handle["):].split(' ')[0]
+        return potential_handle[0:-1]
@@ -0,0 +1,64 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+class KillDedup():
+    """Recently seen kills by fingerprint, for O(1) duplicate checks.
+    Entries are forgotten after window seconds, and the oldest go first once max_entries is reached."""
+    def __init__(self, window:float=6 * 3600, max_entries:int=10000):
+        self.window = window
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    @staticmethod
+    def fingerprint(kill_result:dict) -> tuple:
+        """(timestamp, killer, victim, weapon) of a parsed kill, the log timestamp has millisecond precision."""
+        data = kill_result.get("data") or {}
+        return (data.get("time"), data.get("player"), data.get("victim"), data.get("weapon"))
+
+    @staticmethod
+    def idempotency_key(kill_result:dict) -> str:
+        """Stable key of a kill for the server, the same kill always maps to the same key so a retried upload is never counted twice."""
+        return hashlib.sha256(repr(KillDedup.fingerprint(kill_result)).encode("utf-8")).hexdigest()[:32]
+
+    def _expire(self, now:float) -> None:
+        while self.entries:
+            oldest = next(iter(self.entries.values()))
+            if now - oldest < self.window:
+                break
+            self.entries.popitem(last=False)
+
+    def __contains__(self, fingerprint:tuple) -> bool:
+        with self.lock:
+            self._expire(monotonic())
+            return fingerprint in self.entries
+
+    def add(self, fingerprint:tuple) -> bool:
+        """Remember a fingerprint. Returns False if it was already seen within the window."""
+        with self.lock:
+            now = monotonic()
+            self._expire(now)
+            if fingerprint in self.entries:
+                return False
+            self.entries[fingerprint] = now
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            return True
+
+    def recent(self, limit:int) -> list:
+        """The newest fingerprints still in the window, oldest first, for saving across restarts."""
+        with self.lock:
+            self._expire(monotonic())
+            fingerprints = list(self.entries)
+        return fingerprints[-limit:]
+
+    def restore(self, fingerprints:list) -> None:
+        """Remember fingerprints saved by recent(), e.g. by a previous run of the tracker, as seen just now."""
+        with self.lock:
+            now = monotonic()
+            for fingerprint in fingerprints:
+                self.entries[tuple(fingerprint)] = now
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
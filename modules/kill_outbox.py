@@ -0,0 +1,99 @@
+import json
+import sqlite3
+from threading import Lock
+from time import time
+from pathlib import Path
+
+# Import kill tracker modules
+from modules.kill_dedup import KillDedup
+
+class KillOutbox():
+    """Kills waiting to be uploaded, kept in a small SQLite database in WAL mode next to the config.
+    Enqueueing or acknowledging a kill is one short transaction whatever the number of buffered kills,
+    and every committed kill survives a crash of the tracker. A kill is only stored once, keyed by its
+    idempotency key."""
+    def __init__(self, file_path=None):
+        self.log = None
+        self.file_path = Path(file_path) if file_path else Path.cwd() / "bwc_killtracker.outbox"
+        self.lock = Lock()
+        self.connection = None
+        self.count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            connection = sqlite3.connect(str(self.file_path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS kills ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "idempotency_key TEXT NOT NULL UNIQUE, "
+                "endpoint TEXT NOT NULL, "
+                "kill_result TEXT NOT NULL, "
+                "created REAL NOT NULL)"
+            )
+            connection.commit()
+            self.count = connection.execute("SELECT COUNT(*) FROM kills").fetchone()[0]
+            self.connection = connection
+        return self.connection
+
+    @property
+    def depth(self) -> int:
+        """Number of kills waiting for upload."""
+        with self.lock:
+            self._connect()
+            return self.count
+
+    def enqueue(self, kill_result:dict, endpoint:str="reportKill") -> bool:
+        """Store a kill. Returns False if it is already waiting in the outbox."""
+        with self.lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO kills (idempotency_key, endpoint, kill_result, created) VALUES (?, ?, ?, ?)",
+                    (KillDedup.idempotency_key(kill_result), endpoint, json.dumps(kill_result), time())
+                )
+            self.count += cursor.rowcount
+            return cursor.rowcount == 1
+
+    def peek(self, limit:int=100, min_age:float=0) -> list:
+        """The oldest kills waiting at least min_age seconds as (entry id, kill result) pairs, without removing them."""
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT id, kill_result FROM kills WHERE created <= ? ORDER BY id LIMIT ?", (time() - min_age, limit)
+            ).fetchall()
+        return [(entry_id, json.loads(kill_result)) for entry_id, kill_result in rows]
+
+    def ack(self, entry_ids:list) -> None:
+        """Remove kills that reached the server."""
+        if not entry_ids:
+            return
+        with self.lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.executemany("DELETE FROM kills WHERE id = ?", [(entry_id,) for entry_id in entry_ids])
+            self.count -= cursor.rowcount
+
+    def ack_kills(self, kill_results:list) -> None:
+        """Remove kills that reached the server, looked up by their idempotency key."""
+        if not kill_results:
+            return
+        with self.lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.executemany(
+                    "DELETE FROM kills WHERE idempotency_key = ?", [(KillDedup.idempotency_key(kill_result),) for kill_result in kill_results]
+                )
+            self.count -= cursor.rowcount
+
+    def oldest_age(self) -> float:
+        """Seconds the oldest buffered kill has been waiting, 0 if the outbox is empty."""
+        with self.lock:
+            row = self._connect().execute("SELECT created FROM kills ORDER BY id LIMIT 1").fetchone()
+        return max(time() - row[0], 0) if row else 0
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,137 @@
+import re
+
+# Import kill tracker modules
+from modules.log_record import LogRecord
+
+def compile_literal_set(words:list) -> str:
+    """Build a regex that matches any of the given literals, factored into a prefix trie."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def to_regex(node) -> str:
+        # A literal ending here already matches, anything longer sharing its prefix is redundant
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + to_regex(node[char]) for char in sorted(node)]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return to_regex(trie)
+
+class KillRules():
+    """Precompiled kill filters: the server's ignoredVictimRules and the per game mode exclusions."""
+    # Kill lines to ignore per game mode: (substring, reason), checked in order
+    MODE_EXCLUSIONS = {
+        "EA_FreeFlight": [
+            ("Crash", "Probably a ship reset, ignoring kill!"),
+            ("SelfDestruct", "Self-destruct detected in Free Flight, ignoring kill!"),
+        ],
+        "EA_SquadronBattle": [
+            ("Crash", "Crash detected in Squadron Battle, ignoring kill!"),
+            ("SelfDestruct", "Self-destruct detected in Squadron Battle, ignoring kill!"),
+        ],
+    }
+
+    def __init__(self):
+        self.source_rules = None
+        self.substring_regex = None
+        self.starts_with_regex = None
+        self.regex_rules = []
+        self.invalid_rules = []
+        self.mode_regexes = {
+            game_mode: re.compile("|".join(re.escape(substring) for substring, _ in exclusions))
+            for game_mode, exclusions in self.MODE_EXCLUSIONS.items()
+        }
+
+    def load_ignored_victims(self, ignored_victim_rules:list) -> None:
+        """Compile the server rules into one substring, one startsWith and as few regex matchers as possible."""
+        substrings = []
+        starts_with = []
+        patterns = []
+        invalid_rules = []
+        for data in ignored_victim_rules:
+            ignore_type = data["type"]
+            if ignore_type == "substring":
+                substrings.append(data["value"].lower())
+            elif ignore_type == "startsWith":
+                starts_with.append(data["value"].lower())
+            elif ignore_type == "regex":
+                try:
+                    patterns.append(re.compile(data["value"]))
+                except re.error:
+                    invalid_rules.append(data["value"])
+        self.substring_regex = re.compile(compile_literal_set(substrings)) if substrings else None
+        self.starts_with_regex = re.compile(compile_literal_set(starts_with)) if starts_with else None
+        self.regex_rules = self.merge_patterns(patterns)
+        self.invalid_rules = invalid_rules
+        self.source_rules = ignored_victim_rules
+
+    def merge_patterns(self, patterns:list) -> list:
+        """Merge the regex rules into one alternation. Rules with groups keep their own pattern so backreferences still work."""
+        mergeable = [pattern.pattern for pattern in patterns if pattern.groups == 0]
+        merged = [pattern for pattern in patterns if pattern.groups != 0]
+        if mergeable:
+            try:
+                merged.insert(0, re.compile("|".join(f"(?:{pattern})" for pattern in mergeable)))
+            except re.error:
+                merged = patterns
+        return merged
+
+    def is_ignored_victim(self, ignored_victim_rules:list, line:str) -> bool:
+        """Check the line against the ignored victim rules, recompiling only when the rules list was replaced.
+        Substring and startsWith rules are case-insensitive, regex rules run against the line as is."""
+        if ignored_victim_rules is not self.source_rules:
+            self.load_ignored_victims(ignored_victim_rules)
+        lower_line = line.lower()
+        if self.substring_regex and self.substring_regex.search(lower_line):
+            return True
+        if self.starts_with_regex and self.starts_with_regex.match(lower_line):
+            return True
+        for pattern in self.regex_rules:
+            if pattern.search(line):
+                return True
+        return False
+
+    def exclusion_reason(self, game_mode:str, line:str):
+        """Return why a kill line is excluded in this game mode, or None if it counts."""
+        mode_regex = self.mode_regexes.get(game_mode)
+        if mode_regex is None or not mode_regex.search(line):
+            return None
+        for substring, reason in self.MODE_EXCLUSIONS[game_mode]:
+            if substring in line:
+                return reason
+        return None
+
+def classify_kill(record:LogRecord, curr_user:str, game_mode:str, kill_rules:KillRules, ignored_victim_rules:list=None) -> dict:
+    """Classify a kill line from curr_user's point of view, shared by the live tracker and the backup importer.
+    Returns {"result", "data", "reason"}: data holds player, victim, weapon, zone and time for a suicide, killed or killer result,
+    and is empty for an exclusion (reason says why if a game mode rule excluded it) or a reset. Raises IndexError on a truncated line."""
+    line = record.line
+    reason = kill_rules.exclusion_reason(game_mode, line)
+    if reason:
+        return {"result": "exclusion", "data": {}, "reason": reason}
+    killed = record.victim
+    killer = record.killer
+    if killed == killer:
+        # Current user killed themselves
+        result = "suicide"
+        killer = killed = curr_user
+    elif killed == curr_user:
+        # Current user died
+        result = "killed"
+    elif killer.lower() == "unknown":
+        # Potential Ship reset
+        return {"result": "reset", "data": {}, "reason": None}
+    elif ignored_victim_rules and kill_rules.is_ignored_victim(ignored_victim_rules, line):
+        return {"result": "exclusion", "data": {}, "reason": None}
+    else:
+        # Current user killed something else
+        result = "killer"
+        killer = curr_user
+    data = {"player": killer, "victim": killed, "weapon": record.weapon, "zone": record.zone, "time": record.timestamp}
+    return {"result": result, "data": data, "reason": None}
@@ -0,0 +1,111 @@
+from collections import deque
+from threading import Thread, Condition
+from time import monotonic
+
+# Import kill tracker modules
+from modules.kill_dedup import KillDedup
+
+class KillUploader():
+    """Uploads kills to GrimReaperBot in batches of up to max_batch, collected for at most linger seconds."""
+    def __init__(self, api, max_batch:int=25, linger:float=0.5, batch_retry:float=600):
+        self.log = None
+        self.api = api
+        self.max_batch = max_batch
+        self.linger = linger
+        self.batch_retry = batch_retry
+        self.pending = deque()
+        self.cond = Condition()
+        self.thread = None
+        self.stopping = False
+        self.batch_unavailable_until = 0
+
+    def store(self, kill_result:dict) -> None:
+        """Write a kill to the outbox, it stays there until the upload succeeds."""
+        try:
+            self.api.cfg_handler.outbox.enqueue(kill_result)
+        except Exception as e:
+            self.log.error(f"KillUploader.store(): Error: kill {kill_result} could not be buffered: {e.__class__.__name__} {e}")
+
+    def submit(self, kill_result:dict) -> None:
+        """Queue a kill for upload, starting the upload thread on first use."""
+        with self.cond:
+            self.pending.append(kill_result)
+            if not self.thread or not self.thread.is_alive():
+                self.stopping = False
+                self.thread = Thread(target=self.run, name="kill-uploader", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def take_batch(self) -> list:
+        """Wait for kills, then linger for more until the batch is full."""
+        with self.cond:
+            while not self.pending and not self.stopping:
+                self.cond.wait()
+            deadline = monotonic() + self.linger
+            while len(self.pending) < self.max_batch and not self.stopping:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+            return [self.pending.popleft() for _ in range(min(len(self.pending), self.max_batch))]
+
+    def run(self) -> None:
+        while True:
+            batch = self.take_batch()
+            if not batch:
+                # Stopped with nothing left to post
+                return
+            try:
+                uploaded = self.upload(batch)
+                self.api.cfg_handler.outbox.ack_kills([kill_result for kill_result, ok in zip(batch, uploaded) if ok])
+            except Exception as e:
+                self.log.error(f"KillUploader.run(): Error: {e.__class__.__name__} {e}")
+                uploaded = [False] * len(batch)
+            for kill_result, ok in zip(batch, uploaded):
+                if not ok:
+                    # Normally stored already, this only covers a kill store() could not buffer
+                    self.api.pickle_kill_event(kill_result)
+
+    def stop(self, timeout:float=10) -> None:
+        """Post the kills still queued without lingering, then end the upload thread."""
+        with self.cond:
+            self.stopping = True
+            self.cond.notify()
+        if self.thread:
+            self.thread.join(timeout)
+            if self.thread.is_alive() and self.log:
+                self.log.warning(f"Kill uploader did not finish within {timeout}s, the remaining kills stay in the outbox.")
+
+    def upload(self, kill_results:list) -> list:
+        """Post kills in batches of max_batch. Returns whether each kill is on the server now.
+        Stops at the first failure, the remaining kills would only run into the same error."""
+        uploaded = []
+        for start in range(0, len(kill_results), self.max_batch):
+            batch = kill_results[start:start + self.max_batch]
+            if not all(uploaded):
+                uploaded.extend([False] * len(batch))
+                continue
+            uploaded.extend(self.upload_batch(batch))
+        return uploaded
+
+    def upload_batch(self, kill_results:list) -> list:
+        new_kills = {}
+        for kill_result in kill_results:
+            fingerprint = KillDedup.fingerprint(kill_result)
+            if fingerprint not in self.api.posted_kills:
+                new_kills.setdefault(fingerprint, kill_result)
+        if len(new_kills) > 1 and monotonic() >= self.batch_unavailable_until:
+            accepted = self.api.post_kill_batch(list(new_kills.values()))
+            if accepted is None:
+                self.log.warning(f"Batch kill upload is not available, posting kills one by one for the next {self.batch_retry}s.")
+                self.batch_unavailable_until = monotonic() + self.batch_retry
+            else:
+                return [accepted or KillDedup.fingerprint(kill_result) not in new_kills for kill_result in kill_results]
+        uploaded = []
+        for kill_result in kill_results:
+            if uploaded and not uploaded[-1]:
+                uploaded.append(False)
+                continue
+            # Already posted kills are skipped by post_kill_event
+            uploaded.append(bool(self.api.post_kill_event(kill_result)))
+        return uploaded
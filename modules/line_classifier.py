@@ -0,0 +1,43 @@
+# Event types a Game.log line can be classified as
+EVENT_CONTROL_FLOW = "control_flow"
+EVENT_GAME_MODE = "game_mode"
+EVENT_VEHICLE_SPAWN = "vehicle_spawn"
+EVENT_DESTRUCTION = "destruction"
+EVENT_ZONE = "zone"
+EVENT_KILL = "kill"
+EVENT_JUMP_DRIVE = "jump_drive"
+EVENT_IDENTITY = "identity"
+EVENT_SHUTDOWN = "shutdown"
+
+class LineClassifier():
+    """Finds which known markers a Game.log line holds and maps them to event types.
+    The marker table is ordered by precedence, events come back in that order."""
+    def __init__(self, marker_table:list):
+        self.marker_table = [(marker.encode(), marker, event) for marker, event in marker_table]
+
+    def scan(self, data:bytes, end:int, start:int=0) -> list:
+        """Classify every marker line in data[start:end] (which must start and end on a line break) in one search per marker.
+        data can be bytes or an mmap. Returns (line, events) pairs in file order, lines without a marker are never sliced or decoded."""
+        found = {}
+        for raw_marker, _, event in self.marker_table:
+            pos = data.find(raw_marker, start, end)
+            while pos != -1:
+                line_start = data.rfind(b"\n", start, pos) + 1 or start
+                entry = found.get(line_start)
+                if entry is None:
+                    entry = found[line_start] = [data.find(b"\n", pos, end) + 1, []]
+                if event not in entry[1]:
+                    entry[1].append(event)
+                pos = data.find(raw_marker, entry[0], end)
+        return [
+            (data[line_start:found[line_start][0]].rstrip(b"\r\n").decode("utf-8", errors="replace") + "\n", tuple(found[line_start][1]))
+            for line_start in sorted(found)
+        ]
+
+    def classify(self, line:str) -> tuple:
+        """Classify a single decoded line."""
+        events = []
+        for _, marker, event in self.marker_table:
+            if marker in line and event not in events:
+                events.append(event)
+        return tuple(events)
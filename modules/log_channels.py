@@ -0,0 +1,47 @@
+from os import path
+
+# Import kill tracker modules
+from modules.error_reporter import ErrorReporter
+
+# Release channels Star Citizen installs side by side, each folder with its own Game.log
+CHANNEL_NAMES = ["LIVE", "PTU", "EPTU", "TECH-PREVIEW"]
+
+class LogChannel():
+    """One Game.log the tracker follows (LIVE, PTU, ...) and the game state parsed from it."""
+    def __init__(self, name:str, file_path:str):
+        self.name = name
+        self.file_path = file_path
+        self.tailer = None
+        self.game_mode = "Nothing"
+        self.active_ship = "FPS"
+        self.active_ship_id = "N/A"
+        # Set once its backlog is read or its checkpoint restored, only then is the offset worth saving
+        self.ready = False
+        # Read errors back off per log, so one failing log never stalls or spins the others
+        self.errors = ErrorReporter(f"{name} game log")
+        self.retry_at = 0
+
+def discover_channels(log_file_location:str, extra_locations:list=None) -> list:
+    """The channel of log_file_location first, then the other installed release channels and any configured logs.
+    Channel folders only need to exist, their Game.log is picked up once the game creates it."""
+    locations = [log_file_location]
+    channel_dir = path.dirname(path.abspath(log_file_location))
+    if path.basename(channel_dir).upper() in CHANNEL_NAMES:
+        install_dir = path.dirname(channel_dir)
+        for name in CHANNEL_NAMES:
+            sibling_dir = path.join(install_dir, name)
+            if path.isdir(sibling_dir):
+                locations.append(path.join(sibling_dir, "Game.log"))
+    locations.extend(extra_locations or [])
+    channels = []
+    seen = set()
+    for location in locations:
+        full_path = path.normcase(path.abspath(location))
+        if full_path in seen:
+            continue
+        seen.add(full_path)
+        name = path.basename(path.dirname(path.abspath(location)))
+        if any(channel.name == name for channel in channels):
+            name = location
+        channels.append(LogChannel(name, location))
+    return channels
@@ -0,0 +1,130 @@
+import json
+import argparse
+from os import cpu_count, path
+from pathlib import Path
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Import kill tracker modules
+from modules.identity_scanner import IdentityScanner
+from modules.kill_rules import KillRules, classify_kill
+from modules.log_record import LogRecord
+from modules.line_classifier import LineClassifier, EVENT_GAME_MODE, EVENT_KILL, EVENT_IDENTITY
+
+BACKUP_GLOB = "Game Build(*.log"
+CHUNK_SIZE = 1 << 20
+
+IMPORT_MARKERS = [
+    ("<Context Establisher Done>", EVENT_GAME_MODE),
+    ("CActor::Kill", EVENT_KILL),
+    (IdentityScanner.HANDLE_MARKER, EVENT_IDENTITY),
+]
+
+def find_backup_logs(directory:str) -> list:
+    """Game.log backups in directory or in its logbackups folder, largest first so the pool stays busy to the end."""
+    directory = Path(directory)
+    if (directory / "logbackups").is_dir():
+        directory = directory / "logbackups"
+    return sorted(directory.glob(BACKUP_GLOB), key=lambda file_path: file_path.stat().st_size, reverse=True)
+
+def parse_log_file(file_path:str, ignored_victim_rules:list=None) -> list:
+    """Kills and deaths of the player in one finished Game.log, using the same rules as the live tracker.
+    Runs in a worker process, so it only depends on the parsing modules."""
+    rsi_handle = {"current": None}
+    identity = IdentityScanner(rsi_handle, {"current": None}, lambda identity_type, value: None)
+    # Only the handle is needed, skip the GEID marker
+    identity.geid_found = True
+    kill_rules = KillRules()
+    classifier = LineClassifier(IMPORT_MARKERS)
+    game_mode = "Nothing"
+    history = []
+    source = path.basename(str(file_path))
+    with open(file_path, "rb") as f:
+        partial = b""
+        while True:
+            data = f.read(CHUNK_SIZE)
+            if not data:
+                break
+            data = partial + data
+            line_end = data.rfind(b"\n") + 1
+            partial = data[line_end:]
+            for line, events in classifier.scan(data, line_end):
+                if EVENT_IDENTITY in events:
+                    identity.feed(line)
+                elif EVENT_GAME_MODE in events:
+                    try:
+                        game_mode = LogRecord(line).game_mode
+                    except IndexError:
+                        pass
+                elif rsi_handle["current"] and rsi_handle["current"] in line:
+                    entry = parse_kill(LogRecord(line), rsi_handle["current"], game_mode, kill_rules, ignored_victim_rules)
+                    if entry:
+                        entry["source"] = source
+                        history.append(entry)
+    return history
+
+def parse_kill(record:LogRecord, curr_user:str, game_mode:str, kill_rules:KillRules, ignored_victim_rules:list=None):
+    """History entry of a kill line, classified by classify_kill() like the live tracker, or None if it would not be reported."""
+    try:
+        kill = classify_kill(record, curr_user, game_mode, kill_rules, ignored_victim_rules)
+        data = kill["data"]
+        if not data:
+            return None
+        return {
+            'result': kill["result"],
+            'time': data["time"],
+            'player': data["player"],
+            'victim': data["victim"],
+            'weapon': data["weapon"],
+            'zone': data["zone"],
+            'game_mode': game_mode,
+        }
+    except IndexError:
+        # Truncated line, the game was killed mid-write
+        return None
+
+def merge_history(results) -> list:
+    """Merge the per file histories, keeping one entry per (time, killer, victim), oldest first."""
+    merged = {}
+    for history in results:
+        for entry in history:
+            merged.setdefault((entry["time"], entry["player"], entry["victim"]), entry)
+    return [merged[key] for key in sorted(merged)]
+
+def import_backups(directory:str, ignored_victim_rules:list=None, workers:int=None, log=print) -> list:
+    """Parse every log backup in directory across a process pool and return the merged kill/death history."""
+    files = find_backup_logs(directory)
+    if not files:
+        log(f"import_backups(): No '{BACKUP_GLOB}' files found in {directory}.")
+        return []
+    total_bytes = sum(file_path.stat().st_size for file_path in files)
+    workers = min(workers or cpu_count() or 1, len(files))
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(parse_log_file, [str(file_path) for file_path in files], [ignored_victim_rules] * len(files)))
+    history = merge_history(results)
+    elapsed = max(perf_counter() - start, 1e-9)
+    log(
+        f"Imported {len(history)} kills/deaths from {len(files)} files ({total_bytes / 1e6:.1f} MB) in {elapsed:.2f}s "
+        f"with {workers} workers: {len(files) / elapsed:.1f} files/s, {total_bytes / 1e6 / elapsed:.1f} MB/s."
+    )
+    return history
+
+def main():
+    parser = argparse.ArgumentParser(description="Import kill/death history from Star Citizen Game.log backups.")
+    parser.add_argument("directory", help="Star Citizen LIVE folder or its logbackups folder")
+    parser.add_argument("-o", "--output", default="kill_history.json", help="JSON file to write the history to")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes, defaults to the CPU count")
+    parser.add_argument("--ignored-victim-rules", default=None, help="JSON file with the server's ignoredVictimRules")
+    args = parser.parse_args()
+    ignored_victim_rules = None
+    if args.ignored_victim_rules:
+        with open(args.ignored_victim_rules, "r") as f:
+            ignored_victim_rules = json.load(f)
+    history = import_backups(args.directory, ignored_victim_rules, args.workers)
+    with open(args.output, "w") as f:
+        json.dump(history, f, indent=2)
+    print(f"Wrote {len(history)} entries to {args.output}.")
+
+if __name__ == "__main__":
+    main()
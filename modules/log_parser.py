@@ -1,8 +1,43 @@
-import re
-from time import sleep
-from os import stat
-from threading import Thread
-from fuzzywuzzy import fuzz
+from os import path
+from time import sleep, monotonic
+from threading import Thread, Lock, Event
+
+# Import kill tracker modules
+from modules.log_tailer import LogWatcher, LogTailer
+from modules.identity_scanner import IdentityScanner
+from modules.log_record import LogRecord
+from modules.kill_rules import KillRules, classify_kill
+from modules.name_index import NameIndex
+from modules.event_pipeline import EventPipeline, KillEvent, VehicleEvent
+from modules.checkpoint import Checkpoint
+from modules.kill_dedup import KillDedup
+from modules.error_reporter import ErrorReporter
+from modules.vehicle_parser import VehicleParser
+from modules.log_channels import LogChannel, discover_channels
+from modules.line_classifier import (
+    LineClassifier, EVENT_CONTROL_FLOW, EVENT_GAME_MODE, EVENT_VEHICLE_SPAWN, EVENT_DESTRUCTION,
+    EVENT_ZONE, EVENT_KILL, EVENT_JUMP_DRIVE, EVENT_IDENTITY, EVENT_SHUTDOWN
+)
+from modules.process_watcher import GAME_PROCESS
+
+# Substrings of every Game.log line read_log_line() can act on, all other lines are never decoded.
+# Ordered by the precedence their handlers are tried in.
+LOG_MARKERS = [
+    ("<Vehicle Control Flow>", EVENT_CONTROL_FLOW),
+    ("<Context Establisher Done>", EVENT_GAME_MODE),
+    ("CPlayerShipRespawnManager::OnVehicleSpawned", EVENT_VEHICLE_SPAWN),
+    ("<Vehicle Destruction>", EVENT_DESTRUCTION),
+    ("<local client>: Entering control state dead", EVENT_DESTRUCTION),
+    ("OnEntityEnterZone", EVENT_ZONE),
+    ("CActor::Kill", EVENT_KILL),
+    ("<Jump Drive State Changed>", EVENT_JUMP_DRIVE),
+    ("<SystemQuit>", EVENT_SHUTDOWN),
+]
+
+# Seconds between checkpoint writes while the log keeps growing
+CHECKPOINT_INTERVAL = 10
+# Kills remembered in the checkpoint so a restart replaying the log can't count or post them twice
+CHECKPOINT_KILLS = 1000
 
 class LogParser():
     """Parses the game.log file for Star Citizen."""
@@ -12,6 +47,7 @@ class LogParser():
         self.api = api_client_module
         self.sounds = sound_module
         self.cm = cm_module
+        self.process_watcher = None
         self.local_version = local_version
         self.monitoring = monitoring
         self.discord_id = discord_id
@@ -24,6 +60,15 @@ class LogParser():
         self.game_mode = "Nothing"
         self.active_ship_id = "N/A"
         self.player_geid = player_geid
+        self.identity = None
+        self.tail_thread = None
+        self.tail_lock = Lock()
+        self.tail_stop = Event()
+        self.tail_state = "stopped"
+        self.tail_restarts = 0
+        self.tail_errors = ErrorReporter("tail_log")
+        self.channels = []
+        self.channel = None
         self.log_file_location = None
         self.curr_killstreak = 0
         self.max_killstreak = 0
@@ -35,202 +80,616 @@ class LogParser():
             'KRIG', 'XNAA', 'ARGO', 'VNCL', 'ESPR', 'RSI', 'CNOU',
             'GRIN', 'TMBL', 'GAMA'
         ]
+        self.vehicle_parser = VehicleParser(self.global_ship_list)
+        self.classifier = LineClassifier(LOG_MARKERS)
+        self.kill_rules = KillRules()
+        self.name_indexes = {}
+        self.api.add_data_map_listener("ignoredVictimRules", self.load_ignored_victim_rules)
+        self.api.add_data_map_listener("weapons", self.get_name_index)
+        self.api.add_data_map_listener("zones", self.get_name_index)
+        self.api.add_data_map_listener("vehicles", self.get_name_index)
+        self.api.add_data_map_listener("vehicles", self.vehicle_parser.set_vehicles)
+        self.pipeline = EventPipeline()
+        self.setup_pipeline()
+        self.checkpoint = Checkpoint()
+        self.checkpoint_due = False
+        self.saved_checkpoint = None
+        self.kill_dedup = KillDedup()
+        self.line_handlers = {
+            EVENT_CONTROL_FLOW: self.handle_control_flow,
+            EVENT_GAME_MODE: self.handle_game_mode,
+            EVENT_VEHICLE_SPAWN: self.handle_vehicle_spawn,
+            EVENT_DESTRUCTION: self.handle_destruction,
+            EVENT_ZONE: self.handle_zone,
+            EVENT_KILL: self.handle_kill,
+            EVENT_JUMP_DRIVE: self.handle_jump_drive,
+            EVENT_SHUTDOWN: self.handle_shutdown,
+        }
+
+    def setup_pipeline(self) -> None:
+        """Consumers of the events the tailer produces, each drained by its own thread.
+        Kills are never dropped: if the uploader falls far behind they go straight to the kill buffer."""
+        self.pipeline.add_sink("uploader", self.upload_kill_event, (KillEvent,), maxsize=256, block_timeout=1, on_overflow=lambda event: self.api.pickle_kill_event(event.kill_result))
+        self.pipeline.add_sink("audio", self.play_kill_sound, (KillEvent,), maxsize=4)
+        self.pipeline.add_sink("gui", self.render_event, (KillEvent, VehicleEvent), maxsize=1024, block_timeout=1)
+
+    @property
+    def tailing(self) -> bool:
+        return self.monitoring["active"] and not self.tail_stop.is_set()
+
+    def set_tail_state(self, state:str) -> None:
+        self.tail_state = state
+        self.log.debug(f"Log tailer {state} (restarts: {self.tail_restarts}).")
+
+    def tail_status(self) -> dict:
+        """What the log tailer is doing, for the logs and the GUI."""
+        return {
+            "state": self.tail_state,
+            "alive": bool(self.tail_thread and self.tail_thread.is_alive()),
+            "restarts": self.tail_restarts,
+            "errors": self.tail_errors.stats(),
+            "channel_errors": {channel.name: channel.errors.stats() for channel in self.channels},
+            "channels": [channel.name for channel in self.channels if channel.tailer],
+        }
+
+    def start_tail_log_thread(self, timeout:float=10) -> bool:
+        """Start the log tailing in a separate thread only if it's not already running. Returns True if started."""
+        with self.tail_lock:
+            if self.tail_thread and self.tail_thread.is_alive() and self.tail_stop.is_set():
+                # The previous session's tailer is still winding down, give it time to finish
+                self.tail_thread.join(timeout)
+            if self.tail_thread and self.tail_thread.is_alive():
+                self.log.warning(f"Log tailer is still {self.tail_state}, not starting another one.")
+                return False
+            self.pipeline.log = self.log
+            self.pipeline.start()
+            self.tail_stop.clear()
+            self.tail_restarts = 0
+            self.set_tail_state("starting")
+            self.tail_thread = Thread(target=self.supervise_tail_log, name="tail-log", daemon=True)
+            self.tail_thread.start()
+            return True
+
+    def stop_tail_log_thread(self, timeout:float=10) -> None:
+        """Stop the log tailer and wait for it to finish, so the next game session can't end up with two."""
+        with self.tail_lock:
+            thread = self.tail_thread
+            if not thread:
+                return
+            self.set_tail_state("stopping")
+            self.tail_stop.set()
+            thread.join(timeout)
+            if thread.is_alive():
+                self.log.warning(f"Log tailer did not stop within {timeout}s: {self.tail_status()}")
+                return
+            self.tail_thread = None
+            # Hand the last kills to the server, anything not posted stays in the outbox
+            self.pipeline.stop()
+            self.api.kill_uploader.stop(timeout)
 
-    def start_tail_log_thread(self) -> None:
-        """Start the log tailing in a separate thread only if it's not already running."""
-        thr = Thread(target=self.tail_log, daemon=True)
-        thr.start()
+    def supervise_tail_log(self) -> None:
+        """Run tail_log() in the tailer thread, restarting it with a growing delay if it crashes."""
+        while self.tailing:
+            self.set_tail_state("running")
+            try:
+                self.tail_log()
+                break
+            except Exception as e:
+                self.tail_restarts += 1
+                delay = min(2 ** self.tail_restarts, 60)
+                self.log.error(f"tail_log(): Crashed, restarting in {delay}s: {e.__class__.__name__} {e}")
+                self.set_tail_state("restarting")
+                self.tail_stop.wait(delay)
+        self.set_tail_state("stopped")
 
     def tail_log(self) -> None:
-        """Read the log file and display events in the GUI."""
+        """Read the game logs of every installed release channel and display events in the GUI."""
+        self.checkpoint.log = self.log
+        self.tail_errors.log = self.log
+        watcher = LogWatcher()
+        # Close the logs and the watcher however this ends, a crash restarted by the supervisor must not leak them
         try:
-            sc_log = open(self.log_file_location, "r")
-            if sc_log is None:
-                self.log.error(f"No log file found at {self.log_file_location}")
+            self.identity = IdentityScanner(self.rsi_handle, self.player_geid, self.identity_found)
+            self.channel = None
+            self.channels = discover_channels(self.log_file_location, self.api.cfg_handler.cfg_dict.get("log_paths", []))
+            for channel in self.channels:
+                try:
+                    self.open_channel(channel, watcher)
+                except Exception as e:
+                    self.log.error(f"Error opening log file {channel.file_path}: {e.__class__.__name__} {e}")
+            for channel in self.channels:
+                channel.errors.log = self.log
+            if not self.channels[0].tailer:
+                self.log.error(f"Error opening log file: {self.log_file_location} not found.")
                 return
-        except Exception as e:
-            self.log.error(f"Error opening log file: {e.__class__.__name__} {e}")
-        try:
-            self.log.warning("");
-            self.log.warning("Enter or Load 'SC Kill-Tracker API Key' to establish BWC GrimReaperBot connection...")
-            self.log.warning("");
-            sleep(1)
-            while self.monitoring["active"]:
-                # Block loop until API key is valid
-                if self.api.api_key["value"]:
-                    break
+            try:
+                # Search the logs for the login lines, they are written near the start of a session
+                self.scan_channels_identity()
+                if not self.identity.handle_found:
+                    self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
+                    self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
+            except Exception as e:
+                self.log.error(f"Error finding RSI identity: {e.__class__.__name__} {e}")
+            try:
+                self.log.warning("");
+                self.log.warning("Enter or Load 'SC Kill-Tracker API Key' to establish BWC GrimReaperBot connection...")
+                self.log.warning("");
                 sleep(1)
-            self.log.debug(f"tail_log(): Received key: {self.api.api_key}. Moving on...")
-        except Exception as e:
-            self.log.error(f"Error waiting for GrimReaperBot connection to be established: {e.__class__.__name__} {e}")
+                while self.tailing:
+                    # Block loop until API key is valid
+                    if self.api.api_key["value"]:
+                        break
+                    # Keep following the logs in case the player has not logged in yet
+                    if not self.identity.complete:
+                        self.scan_channels_identity()
+                    sleep(1)
+                self.log.debug(f"tail_log(): Received key: {self.api.api_key}. Moving on...")
+            except Exception as e:
+                self.log.error(f"Error waiting for GrimReaperBot connection to be established: {e.__class__.__name__} {e}")
+            if not self.tailing:
+                # Stopped before a key was entered, nothing was read that a checkpoint could remember
+                return
 
-        try:
-            # Read all lines to find out what game mode player is currently, in case they booted up late.
-            # Don't upload kills, we don't want repeating last session's kills in case they are actually available.
-            self.log.info("Loading old log (if available)! Note that old kills shown will not be uploaded.")
-            lines = sc_log.readlines()
-            for line in lines:
-                if not self.api.api_key["value"]:
-                    self.log.error("Error: key is invalid. Loading old log stopped.")
-                    break
-                self.read_log_line(line, False)
-            # After loading old log, always default to FPS on the label
-            self.active_ship["current"] = "FPS"
-            self.active_ship_id = "N/A"
-            self.gui.update_vehicle_status("FPS")
-        except Exception as e:
-            self.log.error(f"Error reading old log file: {e.__class__.__name__} {e}")
-        
-        try:
-            # Main loop to monitor the log
-            last_log_file_size = stat(self.log_file_location).st_size
-            self.log.debug(f"tail_log(): Last log size: {last_log_file_size}.")
-            self.log.success(f"Kill tracking initiated with Discord ID: {self.discord_id['current']}")
-        except Exception as e:
-            self.log.error(f"Error getting log file size: {e.__class__.__name__} {e}")
-        
-        while self.monitoring["active"]:
-            try:
-                if not self.api.api_key["value"]:
-                    self.log.error("Error: key is invalid. Kill Tracking is not active...")
-                    sleep(5)
+            state = self.checkpoint.load()
+            self.saved_checkpoint = None
+            if state:
+                # Kills already counted and posted before the restart
+                self.kill_dedup.restore(state.get("kills", []))
+            resumed_session = False
+            for channel in self.channels:
+                if not channel.tailer:
                     continue
-                # Handle RSI handle first before continuing
-                if self.rsi_handle["current"] == "N/A":
-                    self.log.error(f"RSI handle name has not been found yet. Retrying ...")
-                    self.rsi_handle["current"] = self.find_rsi_handle()
-                    if self.rsi_handle["current"] != "N/A":
-                        self.log.success(f"Refound RSI handle name: {self.rsi_handle['current']}.")
-                where = sc_log.tell()
-                line = sc_log.readline()
-                if not line:
-                    sleep(1)
-                    sc_log.seek(where)
-                    if last_log_file_size > stat(self.log_file_location).st_size:
-                        sc_log.close()
-                        sc_log = open(self.log_file_location, "r")
-                        last_log_file_size = stat(self.log_file_location).st_size
-                else:
-                    self.read_log_line(line, True)
+                self.switch_channel(channel)
+                channel.ready = False
+                try:
+                    # Restarted mid-session: pick up the saved state and offset instead of replaying the log
+                    channel.ready = self.resume_channel(channel, state)
+                    resumed_session = resumed_session or channel.ready
+                except Exception as e:
+                    self.log.error(f"Error resuming {channel.name} from checkpoint: {e.__class__.__name__} {e}")
+                try:
+                    if not channel.ready:
+                        channel.ready = self.load_backlog(channel)
+                except Exception as e:
+                    self.log.error(f"Error reading old log file: {e.__class__.__name__} {e}")
+            if resumed_session:
+                self.restore_session_counters(state["counters"])
+
+            try:
+                # Main loop to monitor the logs
+                offsets = ", ".join(f"{channel.name} at {channel.tailer.tell()}" for channel in self.channels if channel.tailer)
+                self.log.debug(f"tail_log(): Tailing {offsets} (inotify: {watcher.uses_inotify}).")
+                self.log.success(f"Kill tracking initiated with Discord ID: {self.discord_id['current']}")
             except Exception as e:
-                self.log.error(f"Error reading game log file: {e.__class__.__name__} {e}")
+                self.log.error(f"Error getting log file size: {e.__class__.__name__} {e}")
+        
+            last_checkpoint = monotonic()
+            while self.tailing:
+                try:
+                    if not self.api.api_key["value"]:
+                        self.log.error("Error: key is invalid. Kill Tracking is not active...")
+                        sleep(5)
+                        continue
+                    active = self.read_channels(watcher)
+                    # Checkpoint right after a kill so a restart never replays it
+                    if self.checkpoint_due or monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                        self.save_checkpoint()
+                        last_checkpoint = monotonic()
+                    if not active:
+                        # Sleep until the game appends to one of the logs, backing off while they all stay quiet
+                        watcher.wait()
+                    # Read errors of a single log back off in read_channels, this only resets the loop's own
+                    self.tail_errors.success()
+                except Exception as e:
+                    # Back off instead of spinning on an error that repeats every pass
+                    self.tail_stop.wait(self.tail_errors.report(f"Error reading game log file: {e.__class__.__name__} {e}"))
+            self.tail_errors.close()
+            for channel in self.channels:
+                channel.errors.close()
+            self.save_checkpoint()
+        finally:
+            self.close_channels(watcher)
+        self.log.debug(f"tail_log(): Event pipeline stats: {self.pipeline.stats()}")
+        self.log.debug(f"tail_log(): Log tailer status: {self.tail_status()}")
         self.log.info("Game log monitoring has stopped.")
 
+    def open_channel(self, channel:LogChannel, watcher:LogWatcher) -> bool:
+        """Start following a channel's log from the top, or only watch its folder if the game has not created it yet."""
+        if not path.exists(channel.file_path):
+            watcher.add(channel.file_path)
+            return False
+        markers = LOG_MARKERS + self.identity.markers
+        channel.tailer = LogTailer(channel.file_path, watcher, markers)
+        channel.tailer.open()
+        return True
+
+    def close_channels(self, watcher:LogWatcher) -> None:
+        for channel in self.channels:
+            if channel.tailer:
+                channel.tailer.close()
+                channel.tailer = None
+        watcher.close()
+
+    def read_channels(self, watcher:LogWatcher) -> bool:
+        """Process whatever the game appended to each log since the last call. Returns True if any log had something new.
+        A quiet log costs one read() per wake up, a log the game has not created yet one stat()."""
+        active = False
+        for channel in self.channels:
+            if channel.retry_at > monotonic():
+                # Still backing off after a read error
+                continue
+            try:
+                active = self.read_channel(channel, watcher) or active
+                channel.errors.success()
+            except Exception as e:
+                channel.retry_at = monotonic() + channel.errors.report(f"Error reading {channel.name} game log file: {e.__class__.__name__} {e}")
+        return active
+
+    def read_channel(self, channel:LogChannel, watcher:LogWatcher) -> bool:
+        if not channel.tailer:
+            if self.open_channel(channel, watcher):
+                self.log.info(f"Found the {channel.name} game log, following it.")
+                # Read live from its first line, so there is no backlog to wait for
+                channel.ready = True
+                return True
+            return False
+        lines = channel.tailer.read_chunk_lines()
+        if lines is None:
+            if channel.tailer.reopen_if_rotated():
+                self.log.info(f"New {channel.name} game log detected, following it from the start.")
+                # The offset may match the old log's, save the new file's identity anyway
+                self.checkpoint_due = True
+                return True
+            return False
+        self.switch_channel(channel)
+        for line, events in lines:
+            self.process_line(line, events, True)
+        return True
+
+    def store_channel_state(self) -> None:
+        """Copy the game state of the current channel back into it."""
+        if self.channel:
+            self.channel.game_mode = self.game_mode
+            self.channel.active_ship = self.active_ship["current"]
+            self.channel.active_ship_id = self.active_ship_id
+
+    def switch_channel(self, channel:LogChannel) -> None:
+        """Make channel's game state the one the line handlers work on, parking the state of the previous channel."""
+        if channel is self.channel:
+            return
+        self.store_channel_state()
+        self.channel = channel
+        self.game_mode = channel.game_mode
+        self.active_ship_id = channel.active_ship_id
+        if self.active_ship["current"] != channel.active_ship:
+            self.active_ship["current"] = channel.active_ship
+            self.update_vehicle_status(channel.active_ship)
+
+    def load_backlog(self, channel:LogChannel) -> bool:
+        """Scan back from the end of the log to find out what game mode player is currently, in case they booted up late.
+        Don't upload kills, we don't want repeating last session's kills in case they are actually available.
+        Returns True if the whole backlog was read."""
+        complete = True
+        self.log.info(f"Loading old {channel.name} log (if available)! Note that old kills shown will not be uploaded.")
+        channel.tailer.set_markers(LOG_MARKERS + self.identity.markers)
+        for line, events in channel.tailer.read_backlog(EVENT_GAME_MODE):
+            if not self.api.api_key["value"]:
+                self.log.error("Error: key is invalid. Loading old log stopped.")
+                complete = False
+                break
+            if not self.tailing:
+                complete = False
+                break
+            self.process_line(line, events, False)
+        # After loading old log, always default to FPS on the label
+        self.active_ship["current"] = "FPS"
+        self.active_ship_id = "N/A"
+        self.update_vehicle_status("FPS")
+        return complete
+
+    def session_state(self) -> dict:
+        """Where in each log we are, the game state parsed from it and the session counters."""
+        self.store_channel_state()
+        return {
+            "counters": {
+                "curr_killstreak": self.curr_killstreak,
+                "max_killstreak": self.max_killstreak,
+                "kill_total": self.kill_total,
+                "death_total": self.death_total,
+            },
+            "kills": self.kill_dedup.recent(CHECKPOINT_KILLS),
+            "channels": {
+                channel.name: {
+                    **channel.tailer.identity(),
+                    "offset": channel.tailer.offset,
+                    "game_mode": channel.game_mode,
+                    "active_ship": channel.active_ship,
+                    "active_ship_id": channel.active_ship_id,
+                }
+                for channel in self.channels if channel.tailer and channel.ready
+            },
+        }
+
+    def checkpoint_key(self) -> tuple:
+        """The parts of the session state that move as the logs are read, cheap to compare unlike session_state()."""
+        self.store_channel_state()
+        return (
+            self.curr_killstreak, self.max_killstreak, self.kill_total, self.death_total,
+            tuple(
+                (channel.name, channel.tailer.offset, channel.game_mode, channel.active_ship, channel.active_ship_id)
+                for channel in self.channels if channel.tailer and channel.ready
+            ),
+        )
+
+    def save_checkpoint(self) -> None:
+        """Save the session state unless nothing changed since the last save."""
+        try:
+            forced = self.checkpoint_due
+            self.checkpoint_due = False
+            key = self.checkpoint_key()
+            if not forced and key == self.saved_checkpoint:
+                return
+            self.checkpoint.save(self.session_state())
+            self.saved_checkpoint = key
+        except Exception as e:
+            self.log.error(f"save_checkpoint(): Error: {e.__class__.__name__} {e}")
+
+    def resume_channel(self, channel:LogChannel, state:dict) -> bool:
+        """Restore a channel from the checkpoint if it was taken on this very log file. Returns True if resumed."""
+        if not state:
+            return False
+        saved = state["channels"].get(channel.name)
+        if not self.checkpoint.matches(saved, channel.tailer.identity(), channel.tailer.size()):
+            return False
+        channel.tailer.seek(saved["offset"])
+        channel.tailer.set_markers(LOG_MARKERS + self.identity.markers)
+        self.game_mode = saved["game_mode"]
+        self.active_ship["current"] = saved["active_ship"]
+        self.active_ship_id = saved["active_ship_id"]
+        self.update_vehicle_status(self.active_ship["current"])
+        self.log.info(f"Resuming {channel.name} log at offset {saved['offset']} in game mode {self.game_mode}.")
+        return True
+
+    def restore_session_counters(self, counters:dict) -> None:
+        self.curr_killstreak = counters["curr_killstreak"]
+        self.max_killstreak = counters["max_killstreak"]
+        self.kill_total = counters["kill_total"]
+        self.death_total = counters["death_total"]
+        self.gui.curr_killstreak_label.config(text=f"Current Killstreak: {self.curr_killstreak}", fg="#04B431")
+        self.gui.max_killstreak_label.config(text=f"Max Killstreak: {self.max_killstreak}", fg="#04B431")
+        self.gui.session_kills_label.config(text=f"Total Session Kills: {self.kill_total}", fg="#04B431")
+        self.gui.session_deaths_label.config(text=f"Total Session Deaths: {self.death_total}", fg="red")
+        self.update_kd_ratio()
+        self.log.info(f"Resumed session with {self.kill_total} kills and {self.death_total} deaths.")
+
+    def scan_channels_identity(self) -> None:
+        for channel in self.channels:
+            if self.identity.complete:
+                return
+            if channel.tailer:
+                self.scan_identity(channel.tailer)
+
+    def scan_identity(self, tailer:LogTailer) -> None:
+        """Search what the log has so far for the RSI handle and GEID, only the identity lines are decoded."""
+        if self.identity.complete:
+            return
+        tailer.set_markers(self.identity.markers)
+        for line, _ in tailer.read_mapped_lines():
+            self.identity.feed(line)
+        tailer.set_markers(self.identity.markers)
+
+    def identity_found(self, identity_type:str, value:str) -> None:
+        """Called by the identity scanner once the RSI handle or GEID shows up in the log."""
+        if identity_type == "rsi_handle":
+            self.log.success(f"Current RSI handle is {value}.")
+        else:
+            self.log.debug(f"Current User GEID is {value}.")
+
+    def process_line(self, line:str, events:tuple, upload_kills:bool) -> None:
+        """Route identity lines to the identity scanner and everything else to read_log_line()."""
+        if EVENT_IDENTITY in events:
+            self.identity.feed(line)
+            if self.identity.complete:
+                for channel in self.channels:
+                    if channel.tailer:
+                        channel.tailer.set_markers(LOG_MARKERS)
+            return
+        self.read_log_line(line, upload_kills, events)
+
     def _extract_ship_info(self, line):
-        match = re.search(r"for '([\w]+(?:_[\w]+)+)_(\d+)'", line)
-        if match:
-            ship_type = match.group(1)
-            ship_id = match.group(2)
-            return {"ship_type": ship_type, "ship_id": ship_id}
+        ship = self.vehicle_parser.parse_control_token(line)
+        if ship:
+            return {"ship_type": ship[0], "ship_id": ship[1]}
         return None
 
-    def read_log_line(self, line: str, upload_kills: bool) -> None:
-        if upload_kills and "<Vehicle Control Flow>" in line:
-                if (
-                    ("CVehicleMovementBase::SetDriver:" in line and "requesting control token for" in line) or
-                    ("CVehicle::Initialize::<lambda_1>::operator ():" in line and "granted control token for" in line)
-                ):
-                    ship_data = self._extract_ship_info(line)
-                    if ship_data:
-                        self.active_ship["current"] = ship_data["ship_type"]
-                        self.active_ship_id = ship_data["ship_id"]
-                        self.log.info(f"Entered ship: {self.active_ship['current']} (ID: {self.active_ship_id})")
-                        self.gui.update_vehicle_status(self.active_ship["current"])
-                    return
-                if (
-                    ("CVehicleMovementBase::ClearDriver:" in line and "releasing control token for" in line) or
-                    ("losing control token for" in line)
-                ):
-                    self.active_ship["current"] = "FPS"
-                    self.active_ship_id = "N/A"
-                    self.log.info("Exited ship: Defaulted to FPS (on-foot)")
-                    self.gui.update_vehicle_status("FPS")
-                    return
-                
-        if "<Context Establisher Done>" in line:
-            self.set_game_mode(line)
-            self.log.debug(f"read_log_line(): set_game_mode with: {line}.")
-        elif "CPlayerShipRespawnManager::OnVehicleSpawned" in line and (
-                "SC_Default" != self.game_mode) and (self.player_geid["current"] in line):
-            self.set_ac_ship(line)
-            self.log.debug(f"read_log_line(): set_ac_ship with: {line}.")
-        elif ("<Vehicle Destruction>" in line or
-            "<local client>: Entering control state dead" in line) and (
-                self.active_ship_id in line):
-            self.log.debug(f"read_log_line(): destroy_player_zone with: {line}")
+    def read_log_line(self, line: str, upload_kills: bool, events: tuple = None) -> None:
+        """Dispatch a log line to the handler of each event it holds, in precedence order, until one takes it."""
+        if events is None:
+            events = self.classifier.classify(line)
+        # Shared by the handlers so the line is tokenized at most once
+        record = LogRecord(line)
+        for event in events:
+            handler = self.line_handlers.get(event)
+            if handler and handler(record, upload_kills):
+                return
+
+    def handle_control_flow(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        if not upload_kills:
+            return False
+        if (
+            ("CVehicleMovementBase::SetDriver:" in line and "requesting control token for" in line) or
+            ("CVehicle::Initialize::<lambda_1>::operator ():" in line and "granted control token for" in line)
+        ):
+            ship_data = self._extract_ship_info(line)
+            if ship_data:
+                self.active_ship["current"] = ship_data["ship_type"]
+                self.active_ship_id = ship_data["ship_id"]
+                self.log.info(f"Entered ship: {self.active_ship['current']} (ID: {self.active_ship_id})")
+                self.update_vehicle_status(self.active_ship["current"])
+            return True
+        if (
+            ("CVehicleMovementBase::ClearDriver:" in line and "releasing control token for" in line) or
+            ("losing control token for" in line)
+        ):
+            self.active_ship["current"] = "FPS"
+            self.active_ship_id = "N/A"
+            self.log.info("Exited ship: Defaulted to FPS (on-foot)")
+            self.update_vehicle_status("FPS")
+            return True
+        return False
+
+    def handle_game_mode(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        self.set_game_mode(record)
+        self.log.debug(f"read_log_line(): set_game_mode with: {line}.")
+        return True
+
+    def handle_vehicle_spawn(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        if "SC_Default" == self.game_mode or self.player_geid["current"] not in line:
+            return False
+        self.set_ac_ship(record)
+        self.log.debug(f"read_log_line(): set_ac_ship with: {line}.")
+        return True
+
+    def handle_destruction(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        if self.active_ship_id not in line:
+            return False
+        self.log.debug(f"read_log_line(): destroy_player_zone with: {line}")
+        self.destroy_player_zone()
+        return True
+
+    def handle_zone(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        if self.rsi_handle["current"] not in line:
+            return False
+        self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
+        self.set_player_zone(line, False)
+        # Fall through so a kill on the same line is still handled
+        return False
+
+    def handle_kill(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        if self.rsi_handle["current"] not in line:
+            return False
+        if upload_kills:
+            self.process_kill(record)
+        return True
+
+    def handle_jump_drive(self, record: LogRecord, upload_kills: bool) -> bool:
+        line = record.line
+        # Lines naming the player belong to the zone/kill handlers
+        if self.rsi_handle["current"] in line:
+            return True
+        self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
+        self.set_player_zone(line, True)
+        return True
+
+    def handle_shutdown(self, record: LogRecord, upload_kills: bool) -> bool:
+        # A quit in the old log belongs to a previous session
+        if not upload_kills:
+            return True
+        self.log.info("Star Citizen is shutting down.")
+        if self.process_watcher:
+            self.process_watcher.signal_exit(GAME_PROCESS)
+        return True
+
+    def process_kill(self, record: LogRecord) -> None:
+        """Parse a kill line involving the player, update the session stats and hand it to the pipeline."""
+        line = record.line
+        kill_result = self.parse_kill_line(record)
+        self.log.debug(f"read_log_line(): kill_result with: {line}.")
+        # Do not send
+        if kill_result["result"] == "exclusion" or kill_result["result"] == "reset":
+            self.log.debug(f"read_log_line(): Not posting {kill_result['result']} death: {line}.")
+            return
+        # Same kill read twice, e.g. after the log was reopened
+        if kill_result["data"] and not self.kill_dedup.add(KillDedup.fingerprint(kill_result)):
+            self.log.debug(f"read_log_line(): Ignoring duplicate kill: {line}.")
+            return
+        # Current user's death
+        if kill_result["result"] == "killed" or kill_result["result"] == "suicide":
+            self.curr_killstreak = 0
+            self.death_total += 1
+            # Send death-event to the server via heartbeat
+            #self.cm.post_heartbeat_event(kill_result["data"]["victim"], kill_result["data"]["zone"], None)
             self.destroy_player_zone()
-        elif self.rsi_handle["current"] in line:
-            if "OnEntityEnterZone" in line:
-                self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
-                self.set_player_zone(line, False)
-            if "CActor::Kill" in line and upload_kills:
-                kill_result = self.parse_kill_line(line)
-                self.log.debug(f"read_log_line(): kill_result with: {line}.")
-                # Do not send
-                if kill_result["result"] == "exclusion" or kill_result["result"] == "reset":
-                    self.log.debug(f"read_log_line(): Not posting {kill_result['result']} death: {line}.")
-                    return
-                # Log a message for the current user's death
-                elif kill_result["result"] == "killed" or kill_result["result"] == "suicide":
-                    self.curr_killstreak = 0
-                    self.gui.curr_killstreak_label.config(text=f"Current Killstreak: {self.curr_killstreak}", fg="yellow")
-                    self.death_total += 1
-                    self.gui.session_deaths_label.config(text=f"Total Session Deaths: {self.death_total}", fg="red")
-                    weapon_human_readable = self.convert_string(self.api.sc_data["weapons"], kill_result["data"]["weapon"], base_variant=False, fuzzy_search=False)
-                    if kill_result["result"] == "killed":
-                        self.log.info(f'☠ You were killed by {kill_result["data"]["player"]} with {weapon_human_readable}.')
-                    elif kill_result["result"] == "suicide":
-                        if kill_result["data"]["weapon"] == kill_result["data"]["victim"]:
-                            self.log.info('☠ You died via backspace')
-                        else:
-                            self.log.info(f'☠ You died from {weapon_human_readable}.')
-                    # Send death-event to the server via heartbeat
-                    #self.cm.post_heartbeat_event(kill_result["data"]["victim"], kill_result["data"]["zone"], None)
-                    self.destroy_player_zone()
-                    self.update_kd_ratio()
-                    self.api.post_kill_event(kill_result)
-                # Log a message for the current user's kill
-                elif kill_result["result"] == "killer":
-                    self.curr_killstreak += 1
-                    if self.curr_killstreak > self.max_killstreak:
-                        self.max_killstreak = self.curr_killstreak
-                    self.kill_total += 1
-                    self.gui.curr_killstreak_label.config(text=f"Current Killstreak: {self.curr_killstreak}", fg="#04B431")
-                    self.gui.max_killstreak_label.config(text=f"Max Killstreak: {self.max_killstreak}", fg="#04B431")
-                    self.gui.session_kills_label.config(text=f"Total Session Kills: {self.kill_total}", fg="#04B431")
-                    weapon_human_readable = self.convert_string(self.api.sc_data["weapons"], kill_result["data"]["weapon"], base_variant=False, fuzzy_search=False)
-                    self.log.info(f"🔫 You have killed {kill_result['data']['victim']} with {weapon_human_readable}")
-                    self.sounds.play_random_sound()
-                    self.update_kd_ratio()
-                    self.api.post_kill_event(kill_result)
-                else:
-                    self.log.error(f"Kill failed to parse with result {kill_result['result']} RAW LINE: {line}.")
-        elif "<Jump Drive State Changed>" in line:
-            self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
-            self.set_player_zone(line, True)
-
-    def set_game_mode(self, line:str) -> None:
+        # Current user's kill
+        elif kill_result["result"] == "killer":
+            self.curr_killstreak += 1
+            if self.curr_killstreak > self.max_killstreak:
+                self.max_killstreak = self.curr_killstreak
+            self.kill_total += 1
+        else:
+            self.log.error(f"Kill failed to parse with result {kill_result['result']} RAW LINE: {line}.")
+            return
+        # Keep the kill in the outbox from here on, so a crash or shutdown before the upload never loses it
+        self.api.store_kill_event(kill_result)
+        self.pipeline.publish(KillEvent(kill_result, self.curr_killstreak, self.max_killstreak, self.kill_total, self.death_total))
+        self.checkpoint_due = True
+
+    def upload_kill_event(self, event:KillEvent) -> None:
+        """Uploader sink, the kill uploader batches kills that arrive close together."""
+        self.api.kill_uploader.submit(event.kill_result)
+
+    def play_kill_sound(self, event:KillEvent) -> None:
+        """Audio sink."""
+        if event.result == "killer":
+            self.sounds.play_random_sound()
+
+    def render_event(self, event) -> None:
+        """GUI and session stats sink."""
+        if isinstance(event, VehicleEvent):
+            self.gui.update_vehicle_status(event.status)
+            return
+        kill_result = event.kill_result
+        weapon_human_readable = self.convert_string(self.api.sc_data["weapons"], kill_result["data"]["weapon"], base_variant=False, fuzzy_search=False)
+        # Log a message for the current user's death
+        if kill_result["result"] == "killed" or kill_result["result"] == "suicide":
+            self.gui.curr_killstreak_label.config(text=f"Current Killstreak: {event.curr_killstreak}", fg="yellow")
+            self.gui.session_deaths_label.config(text=f"Total Session Deaths: {event.death_total}", fg="red")
+            if kill_result["result"] == "killed":
+                self.log.info(f'☠ You were killed by {kill_result["data"]["player"]} with {weapon_human_readable}.')
+            elif kill_result["data"]["weapon"] == kill_result["data"]["victim"]:
+                self.log.info('☠ You died via backspace')
+            else:
+                self.log.info(f'☠ You died from {weapon_human_readable}.')
+        # Log a message for the current user's kill
+        else:
+            self.gui.curr_killstreak_label.config(text=f"Current Killstreak: {event.curr_killstreak}", fg="#04B431")
+            self.gui.max_killstreak_label.config(text=f"Max Killstreak: {event.max_killstreak}", fg="#04B431")
+            self.gui.session_kills_label.config(text=f"Total Session Kills: {event.kill_total}", fg="#04B431")
+            zone_human_readable = self.convert_zone_string(kill_result["data"]["zone"])
+            self.log.info(f"🔫 You have killed {kill_result['data']['victim']} with {weapon_human_readable} in {zone_human_readable}")
+        self.update_kd_ratio(event.kill_total, event.death_total)
+
+    def update_vehicle_status(self, status:str) -> None:
+        """Queue a vehicle status change for the GUI."""
+        self.pipeline.publish(VehicleEvent(status))
+
+    def set_game_mode(self, record:LogRecord) -> None:
         """Parse log for current active game mode."""
-        split_line = line.split(' ')
-        curr_game_mode = split_line[8].split("=")[1].strip("\"")
+        curr_game_mode = record.game_mode
         if self.game_mode != curr_game_mode:
             self.game_mode = curr_game_mode
         if "SC_Default" == curr_game_mode:
             self.active_ship["current"] = "FPS"
             self.active_ship_id = "N/A"
-            self.gui.update_vehicle_status("FPS")
+            self.update_vehicle_status("FPS")
 
-    def set_ac_ship(self, line:str) -> None:
+    def set_ac_ship(self, record:LogRecord) -> None:
         """Parse log for current active ship."""
-        self.active_ship["current"] = line.split(' ')[5][1:-1]
+        self.active_ship["current"] = record.spawned_vehicle
         self.log.debug(f"Player has entered ship: {self.active_ship['current']}")
-        self.gui.update_vehicle_status(self.active_ship["current"])
+        self.update_vehicle_status(self.active_ship["current"])
 
     def destroy_player_zone(self) -> None:
         self.log.debug(f"Ship Destroyed: {self.active_ship['current']} with ID: {self.active_ship_id}")
         self.active_ship["current"] = "FPS"
         self.active_ship_id = "N/A"
-        self.gui.update_vehicle_status("FPS")
+        self.update_vehicle_status("FPS")
 
     def set_player_zone(self, line: str, use_jd) -> None:
         """Set current active ship zone."""
@@ -241,136 +700,68 @@ class LogParser():
         if 0 == line_index:
             self.log.debug(f"Active Zone Change: {self.active_ship['current']}")
             self.active_ship["current"] = "FPS"
-            self.gui.update_vehicle_status("FPS")
+            self.update_vehicle_status("FPS")
             return
         if not use_jd:
             potential_zone = line[line_index:].split(' ')[0]
             potential_zone = potential_zone[1:-1]
         else:
             potential_zone = line[line_index:].split(' ')[0]
-        for x in self.global_ship_list:
-            if potential_zone.startswith(x):
-                self.active_ship["current"] = potential_zone[:potential_zone.rindex('_')]
-                self.active_ship_id = potential_zone[potential_zone.rindex('_') + 1:]
-                self.log.debug(f"Active Zone Change: {self.active_ship['current']} with ID: {self.active_ship_id}")
-                #self.cm.post_heartbeat_event(None, None, self.active_ship["current"])
-                self.gui.update_vehicle_status(self.active_ship["current"])
-                return
+        ship = self.vehicle_parser.parse_vehicle(potential_zone)
+        if ship:
+            self.active_ship["current"], self.active_ship_id = ship
+            self.log.debug(f"Active Zone Change: {self.active_ship['current']} with ID: {self.active_ship_id}")
+            #self.cm.post_heartbeat_event(None, None, self.active_ship["current"])
+            self.update_vehicle_status(self.active_ship["current"])
 
     def check_exclusion_scenarios(self, line:str) -> bool:
         """Check for kill edgecase scenarios."""
-        if self.game_mode == "EA_FreeFlight":
-            if "Crash" in line:
-                self.log.info("Probably a ship reset, ignoring kill!")
-                return False
-            if "SelfDestruct" in line:
-                self.log.info("Self-destruct detected in Free Flight, ignoring kill!")
-                return False
-
-        elif self.game_mode == "EA_SquadronBattle":
-            # Add your specific conditions for Squadron Battle mode
-            if "Crash" in line:
-                self.log.info("Crash detected in Squadron Battle, ignoring kill!")
-                return False
-            if "SelfDestruct" in line:
-                self.log.info("Self-destruct detected in Squadron Battle, ignoring kill!")
-                return False
+        reason = self.kill_rules.exclusion_reason(self.game_mode, line)
+        if reason:
+            self.log.info(reason)
+            return False
         return True
 
-    def parse_kill_line(self, line:str):
+    def parse_kill_line(self, record:LogRecord):
         """Parse kill event."""
         try:
-            kill_result = {"result": "", "data": {}}
-
-            if not self.check_exclusion_scenarios(line):
-                kill_result["result"] = "exclusion"
-                return kill_result
-            
-            split_line = line.split(' ')
-
-            kill_time = split_line[0].strip('\'')
-            killed = split_line[5].strip('\'')
-
-            zone = split_line[9].strip('\'')
-
-            killer = split_line[12].strip('\'')
-            
-            weapon = split_line[15].strip('\'')
-            weapon = weapon.strip()
-            weapon = re.sub(r'_\d+$', '', weapon) # Remove trailing _<digits>
-
-            curr_user = self.rsi_handle["current"]
-
-            if killed == killer:
-                # Current user killed themselves
-                kill_result["result"] = "suicide"
-                kill_result["data"] = {
-                    'discord_id': self.discord_id["current"],
-                    'player': curr_user,
-                    'victim': curr_user,
-                    'weapon': weapon,
-                    'zone': zone,
-                    'current_ship': self.active_ship["current"],
-                    'game_mode': self.game_mode,
-                    'time': kill_time,
-                    'client_ver': self.local_version,
-                    'anonymize_state': self.anonymize_state
-                }
-            elif killed == curr_user:
-                # Current user died
-                kill_result["result"] = "killed"
-                kill_result["data"] = {
-                    'discord_id': self.discord_id["current"],
-                    'player': killer,
-                    'victim': curr_user,
-                    'weapon': weapon,
-                    'zone': self.active_ship["current"],
-                    'current_ship': self.active_ship["current"],
-                    'game_mode': self.game_mode,
-                    'time': kill_time,
-                    'client_ver': self.local_version,
-                    'anonymize_state': self.anonymize_state
-                }
-            elif killer.lower() == "unknown":
-                # Potential Ship reset
-                kill_result["result"] = "reset"
-            else:
-                # Current user killed something else
-                if self.check_ignored_victims(self.api.sc_data["ignoredVictimRules"], line):
-                    kill_result["result"] = "exclusion"
-                    return kill_result
-                kill_result["result"] = "killer"
-                kill_result["data"] = {
-                    'discord_id': self.discord_id["current"],
-                    'ping_self': self.api.cfg_handler.cfg_dict.get("ping", False),
-                    'player': curr_user,
-                    'victim': killed,
-                    'weapon': weapon,
-                    'zone': zone,
-                    'current_ship': self.active_ship["current"],
-                    'game_mode': self.game_mode,
-                    'time': kill_time,
-                    'client_ver': self.local_version,
-                    'anonymize_state': self.anonymize_state
-                }
+            kill = classify_kill(record, self.rsi_handle["current"], self.game_mode, self.kill_rules, self.api.sc_data["ignoredVictimRules"])
+            if kill["reason"]:
+                self.log.info(kill["reason"])
+            data = kill["data"]
+            if not data:
+                return {"result": kill["result"], "data": {}}
+            kill_result = {"result": kill["result"], "data": {'discord_id': self.discord_id["current"]}}
+            if kill["result"] == "killer":
+                kill_result["data"]['ping_self'] = self.api.cfg_handler.cfg_dict.get("ping", False)
+            kill_result["data"].update({
+                'player': data["player"],
+                'victim': data["victim"],
+                'weapon': data["weapon"],
+                # A death is reported in the ship the player was flying
+                'zone': self.active_ship["current"] if kill["result"] == "killed" else data["zone"],
+                'current_ship': self.active_ship["current"],
+                'game_mode': self.game_mode,
+                'time': data["time"],
+                'client_ver': self.local_version,
+                'anonymize_state': self.anonymize_state
+            })
             return kill_result
         except Exception as e:
             self.log.error(f"parse_kill_line(): Error: {e.__class__.__name__} {e}")
             return {"result": "", "data": None}
 
-    def parse_death_line(self, line:str, curr_user:str):
+    def parse_death_line(self, record:LogRecord, curr_user:str):
         """Parse death event."""
         try:
             death_result = {"result": "", "data": {}}
 
-            if not self.check_exclusion_scenarios(line):
+            if not self.check_exclusion_scenarios(record.line):
                 death_result["result"] = "exclusion"
                 return death_result
 
-            split_line = line.split(' ')
-
-            kill_time = split_line[0].strip('\'')
-            killer = split_line[12].strip('\'')
+            kill_time = record.timestamp
+            killer = record.killer
 
             death_result["result"] = "killed"
             death_result["data"] = {
@@ -384,86 +775,67 @@ class LogParser():
             self.log.error(f"parse_death_line(): Error: {e.__class__.__name__} {e}")
             return {"result": "", "data": None}
 
+    def load_ignored_victim_rules(self, ignored_victim_rules) -> None:
+        """Recompile the ignored victim rules when GrimReaperBot sends new ones."""
+        self.kill_rules.load_ignored_victims(ignored_victim_rules)
+        for rule in self.kill_rules.invalid_rules:
+            self.log.warning(f"Ignoring invalid ignored victim regex rule: {rule}")
+
     def check_ignored_victims(self, ignored_victim_rules, line:str) -> bool:
         """Check if any ignored victims are present in the given line."""
-        for data in ignored_victim_rules:
-            ignore_type = data["type"]
-            if ignore_type == "substring" and data["value"].lower() in line.lower():
-                return True
-            elif ignore_type == "startsWith" and line.lower().startswith(data["value"].lower()):
-                return True
-            elif ignore_type == "regex" and re.search(data["value"], line):
-                return True
-        return False
+        return self.kill_rules.is_ignored_victim(ignored_victim_rules, line)
+
+    def get_name_index(self, data_map) -> NameIndex:
+        """Get the name index for a data map, building it the first time that map is seen."""
+        index = self.name_indexes.get(id(data_map))
+        if index is None or index.source is not data_map:
+            if len(self.name_indexes) >= len(self.api.sc_data):
+                # Maps are replaced wholesale on refresh, drop indexes of the old ones
+                self.name_indexes.clear()
+            index = NameIndex(data_map)
+            self.name_indexes[id(data_map)] = index
+        return index
+
+    def convert_zone_string(self, zone:str) -> str:
+        """Get a human readable name for a kill zone, which is either a vehicle entity or a location."""
+        for data_type in ("vehicles", "zones"):
+            human_readable = self.convert_string(self.api.sc_data[data_type], zone, base_variant=False, fuzzy_search=True)
+            if human_readable != zone:
+                return human_readable
+        return zone
 
     # NOTE: This is a synomous function used in GrimReaperBot - Changes or enhancements should be mirrored to it (besides the 'self' param)
     def convert_string(self, data_map, src_string:str, base_variant:bool, fuzzy_search:bool) -> str:
         """Get the best human readable string from the established data maps"""
         try:
+            index = self.get_name_index(data_map)
             if fuzzy_search:
-                fuzzy_found_dict = {}
-                for key, value in data_map.items():
-                    pts = fuzz.ratio(key, src_string)
-                    if pts >= 90:
-                        fuzzy_found_dict[value] = pts
-        
-                if len(fuzzy_found_dict) > 0:
-                    # Sort the fuzzy matches by their score and return the best match
-                    sorted_fuzzy = dict(sorted(fuzzy_found_dict.items(), key=lambda item: item[1], reverse=True))
-                    return list(sorted_fuzzy.keys())[0]
+                # Best fuzz.ratio >= 90 match, scoring only the candidates the length and bigram filters let through
+                human_readable = index.fuzzy_resolve(src_string)
+                if human_readable is not None:
+                    return human_readable
             else:
-                best_key_match = ""
-                for key in data_map.keys():
-                    # if src_string contains key
-                    if src_string.startswith(key):
-                        if base_variant:
-                            if best_key_match == "" or len(key) < len(best_key_match):
-                                best_key_match = key
-                        else:
-                            if len(key) > len(best_key_match):
-                                best_key_match = key
-                if best_key_match:
-                    return data_map[best_key_match]
+                # Longest class name src_string starts with, or the shortest one for the base variant
+                human_readable = index.resolve(src_string, base_variant)
+                if human_readable is not None:
+                    return human_readable
         except Exception as e:
             print(f"Error in convert_string: {e}")
         return src_string
 
-    def find_rsi_handle(self) -> str:
-        """Get the current user's RSI handle."""
-        acct_str = "<Legacy login response> [CIG-net] User Login Success"
-        sc_log = open(self.log_file_location, "r")
-        lines = sc_log.readlines()
-        for line in lines:
-            if -1 != line.find(acct_str):
-                line_index = line.index("Handle[") + len("Handle[")
-                if 0 == line_index:
-                    self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
-                    self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
-                    return "N/A"
-                potential_handle = line[line_index:].split(' ')[0]
-                return potential_handle[0:-1]
-        self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
-        self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
-        return "N/A"
-
-    def find_rsi_geid(self) -> str:
-        """Get the current user's GEID."""
-        acct_kw = "AccountLoginCharacterStatus_Character"
-        sc_log = open(self.log_file_location, "r")
-        lines = sc_log.readlines()
-        for line in lines:
-            if -1 != line.find(acct_kw):
-                return line.split(' ')[11]
-                
-    def update_kd_ratio(self) -> None:
+    def update_kd_ratio(self, kill_total:int=None, death_total:int=None) -> None:
         """Update KDR."""
-        self.log.debug(f"update_kd_ratio(): Kills={self.kill_total}, Deaths={self.death_total}")
-        if self.kill_total == 0 and self.death_total == 0:
+        if kill_total is None:
+            kill_total = self.kill_total
+        if death_total is None:
+            death_total = self.death_total
+        self.log.debug(f"update_kd_ratio(): Kills={kill_total}, Deaths={death_total}")
+        if kill_total == 0 and death_total == 0:
             kd_display = "--"
-        elif self.death_total == 0:
+        elif death_total == 0:
             kd_display = "∞"
         else:
-            kd = self.kill_total / self.death_total
+            kd = kill_total / death_total
             kd_display = f"{kd:.2f}"
         # Update the KD label in the GUI
         if hasattr(self.gui, 'kd_ratio_label'):
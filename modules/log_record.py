@@ -0,0 +1,70 @@
+import re
+
+class LogRecord():
+    """A Game.log line whose space separated fields are located on demand.
+    Only the offsets up to the highest field asked for are found, and only the asked fields are sliced out."""
+    __slots__ = ("line", "_starts")
+
+    # Field positions of a space separated log line
+    TIMESTAMP = 0
+    KILL_VICTIM = 5
+    KILL_ZONE = 9
+    KILL_KILLER = 12
+    KILL_WEAPON = 15
+    SPAWNED_VEHICLE = 5
+    GAME_MODE = 8
+    GEID = 11
+
+    WEAPON_ID_SUFFIX = re.compile(r'_\d+$')
+
+    def __init__(self, line:str):
+        self.line = line
+        self._starts = [0]
+
+    def field(self, index:int) -> str:
+        """Same as line.split(' ')[index] without splitting the rest of the line."""
+        starts = self._starts
+        line = self.line
+        while len(starts) <= index + 1:
+            pos = line.find(' ', starts[-1])
+            if pos == -1:
+                break
+            starts.append(pos + 1)
+        if index >= len(starts):
+            raise IndexError(f"log line has no field {index}")
+        end = starts[index + 1] - 1 if index + 1 < len(starts) else len(line)
+        return line[starts[index]:end]
+
+    @property
+    def timestamp(self) -> str:
+        return self.field(self.TIMESTAMP).strip('\'')
+
+    @property
+    def victim(self) -> str:
+        return self.field(self.KILL_VICTIM).strip('\'')
+
+    @property
+    def zone(self) -> str:
+        return self.field(self.KILL_ZONE).strip('\'')
+
+    @property
+    def killer(self) -> str:
+        return self.field(self.KILL_KILLER).strip('\'')
+
+    @property
+    def weapon(self) -> str:
+        """Weapon class name with the trailing _<entity id> removed."""
+        weapon = self.field(self.KILL_WEAPON).strip('\'').strip()
+        return self.WEAPON_ID_SUFFIX.sub('', weapon)
+
+    @property
+    def game_mode(self) -> str:
+        return self.field(self.GAME_MODE).split("=")[1].strip("\"")
+
+    @property
+    def spawned_vehicle(self) -> str:
+        return self.field(self.SPAWNED_VEHICLE)[1:-1]
+
+    @property
+    def geid(self) -> str:
+        return self.field(self.GEID)
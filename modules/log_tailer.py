@@ -0,0 +1,294 @@
+import sys
+import mmap
+import ctypes
+import hashlib
+import ctypes.util
+from os import stat, fstat, read, close, path
+from select import select
+from time import sleep
+
+# Import kill tracker modules
+from modules.line_classifier import LineClassifier
+
+# inotify(7) flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+class LogWatcher():
+    """Wakes the log tailer when a watched file changes (inotify on Linux, adaptive polling elsewhere)."""
+    def __init__(self, min_interval:float=0.05, max_interval:float=4.0, backoff:float=1.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.inotify_fd = None
+        self.watches = {}
+        self._libc = None
+        if sys.platform.startswith("linux"):
+            self._init_inotify()
+
+    def _init_inotify(self) -> None:
+        """Open an inotify instance, leaving the watcher in polling mode if that fails."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return
+            self._libc = libc
+            self.inotify_fd = fd
+        except Exception:
+            self._libc = None
+            self.inotify_fd = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.inotify_fd is not None
+
+    def add(self, file_path:str) -> None:
+        """Watch the directory holding file_path so appends, truncation and replacement all wake us."""
+        directory = path.dirname(path.abspath(file_path))
+        if not self.uses_inotify or directory in self.watches:
+            return
+        wd = self._libc.inotify_add_watch(self.inotify_fd, directory.encode(), IN_WATCH_MASK)
+        if wd >= 0:
+            self.watches[directory] = wd
+
+    def reset(self) -> None:
+        """Data arrived, so poll eagerly again."""
+        self.interval = self.min_interval
+
+    def wait(self) -> bool:
+        """Block until a watched file changes or the current interval elapses. Returns True if woken by an event."""
+        if self.uses_inotify and self.watches:
+            # Events wake us immediately, the timeout only bounds how long a missed event can go unnoticed
+            ready, _, _ = select([self.inotify_fd], [], [], self.max_interval)
+            if ready:
+                self._drain_events()
+                return True
+            return False
+        sleep(self.interval)
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+        return False
+
+    def _drain_events(self) -> None:
+        """Discard pending inotify events, the tailer only needs to know that something changed."""
+        try:
+            while read(self.inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        if self.inotify_fd is not None:
+            close(self.inotify_fd)
+            self.inotify_fd = None
+            self.watches.clear()
+
+class LogTailer():
+    """Follows a growing log file in binary chunks, decoding only the lines that contain a known marker."""
+    # Bytes at the top of the log fingerprinted to tell sessions apart, the first line holds the session start time
+    HEAD_SIZE = 512
+
+    def __init__(self, file_path:str, watcher:LogWatcher, markers:list, chunk_size:int=1 << 20, map_window:int=16 << 20):
+        self.file_path = file_path
+        self.watcher = watcher
+        self.chunk_size = chunk_size
+        self.map_window = map_window
+        self.classifier = None
+        self.set_markers(markers)
+        self.file = None
+        self.partial = b""
+
+    def set_markers(self, markers:list) -> None:
+        """Change which lines get decoded from here on. markers is a list of (marker, event type) pairs."""
+        self.classifier = LineClassifier(markers)
+
+    def open(self, at_end:bool=False) -> None:
+        self.close()
+        self.file = open(self.file_path, "rb")
+        if at_end:
+            self.file.seek(0, 2)
+        self.partial = b""
+        self.watcher.add(self.file_path)
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    @property
+    def offset(self) -> int:
+        """End of the last complete line handed out, where reading has to resume after a restart."""
+        return self.file.tell() - len(self.partial)
+
+    def seek(self, offset:int) -> None:
+        self.file.seek(offset)
+        self.partial = b""
+
+    def size(self) -> int:
+        return fstat(self.file.fileno()).st_size
+
+    def identity(self) -> dict:
+        """Device, inode and a fingerprint of the first bytes of the open log.
+        Inodes get reused once a file is deleted, the fingerprint tells those sessions apart."""
+        file_stat = fstat(self.file.fileno())
+        pos = self.file.tell()
+        self.file.seek(0)
+        head = self.file.read(self.HEAD_SIZE)
+        self.file.seek(pos)
+        return {"dev": file_stat.st_dev, "ino": file_stat.st_ino, "head": hashlib.sha1(head).hexdigest()}
+
+    def read_chunk_lines(self):
+        """Read the next chunk and return its (line, events) pairs, or None when there is nothing new to read.
+        A trailing partial line is held back until the game finishes writing it."""
+        data = self.file.read(self.chunk_size)
+        if not data:
+            return None
+        self.watcher.reset()
+        if self.partial:
+            data = self.partial + data
+        line_end = data.rfind(b"\n") + 1
+        self.partial = data[line_end:]
+        return self.classifier.scan(data, line_end)
+
+    def mapped_windows(self, start:int, end:int, reverse:bool=False):
+        """Yield (mapping, window start, window end) for [start, end) of the log, mapped map_window bytes at a time."""
+        fileno = self.file.fileno()
+        window = self.map_window
+        pos = end if reverse else start
+        while (pos > start) if reverse else (pos < end):
+            if reverse:
+                map_start = max(start, pos - window)
+                map_start -= map_start % mmap.ALLOCATIONGRANULARITY
+                length = pos - map_start
+            else:
+                map_start = pos - pos % mmap.ALLOCATIONGRANULARITY
+                length = min(end - map_start, window)
+            # Touching a mapped page past the end of a truncated file raises SIGBUS, let the caller read it in chunks instead
+            if fstat(fileno).st_size < map_start + length:
+                raise OSError(f"{self.file_path} shrank below offset {map_start + length}")
+            with mmap.mmap(fileno, length, access=mmap.ACCESS_READ, offset=map_start) as mapped:
+                if reverse:
+                    # Skip the line the window starts in the middle of, the next window picks it up
+                    cut = start if map_start <= start else map_start + mapped.find(b"\n") + 1
+                    bounds = (cut - map_start, pos - map_start)
+                    progress = cut < pos and cut > map_start or map_start <= start
+                else:
+                    # Stop after the last complete line, the next window picks up from there
+                    cut = end if map_start + length == end else map_start + mapped.rfind(b"\n", pos - map_start) + 1
+                    bounds = (pos - map_start, cut - map_start)
+                    progress = cut > pos
+                if not progress:
+                    # A single line longer than the window
+                    window *= 2
+                    continue
+                yield mapped, bounds[0], bounds[1]
+            pos = cut
+            window = self.map_window
+
+    def read_mapped_lines(self) -> list:
+        """Classify every complete line from the read position to the end of the log, searching the mapped file.
+        Only marker lines are materialized, the read position moves past the last complete line."""
+        start = self.offset
+        end = self._last_line_end(self.size())
+        if end <= start:
+            return []
+        lines = []
+        try:
+            for mapped, window_start, window_end in self.mapped_windows(start, end):
+                lines.extend(self.classifier.scan(mapped, window_end, window_start))
+        except OSError:
+            # Can't be mapped, stream it instead
+            self.seek(start)
+            return [line for lines in iter(self.read_chunk_lines, None) for line in lines]
+        self.seek(end)
+        return lines
+
+    def read_backlog(self, stop_event:str) -> list:
+        """Collect the (line, events) pairs from the latest stop_event line to the end of the log, in file order.
+        The mapped log is searched backwards for stop_event's markers, then only the lines after it are classified.
+        Leaves the file positioned for live tailing, so the cost is bounded by the activity since stop_event
+        rather than the size of the log."""
+        handoff = self._last_line_end(self.size())
+        stop_markers = [raw_marker for raw_marker, _, event in self.classifier.marker_table if event == stop_event]
+        collected = []
+        try:
+            for mapped, window_start, window_end in self.mapped_windows(0, handoff, reverse=True):
+                stop = max(mapped.rfind(raw_marker, window_start, window_end) for raw_marker in stop_markers) if stop_markers else -1
+                if stop != -1:
+                    line_start = mapped.rfind(b"\n", window_start, stop) + 1 or window_start
+                    collected.append(self.classifier.scan(mapped, window_end, line_start))
+                    break
+                collected.append(self.classifier.scan(mapped, window_end, window_start))
+        except OSError:
+            return self._read_backlog_chunked(stop_event)
+        self.seek(handoff)
+        return [line for lines in reversed(collected) for line in lines]
+
+    def _read_backlog_chunked(self, stop_event:str) -> list:
+        """read_backlog() for logs that can't be mapped, scanning backwards in chunks."""
+        self.file.seek(0, 2)
+        handoff = self._last_line_end(self.file.tell())
+        collected = []
+        carry = b""
+        pos = handoff
+        while pos > 0:
+            start = max(0, pos - self.chunk_size)
+            self.file.seek(start)
+            data = self.file.read(pos - start) + carry
+            pos = start
+            if start > 0:
+                # The first line of the chunk started in an earlier chunk, finish it on the next pass
+                cut = data.find(b"\n") + 1
+                if cut == 0:
+                    carry = data
+                    continue
+                carry = data[:cut]
+                data = data[cut:]
+            lines = self.classifier.scan(data, len(data))
+            for index in range(len(lines) - 1, -1, -1):
+                if stop_event in lines[index][1]:
+                    collected.append(lines[index:])
+                    pos = 0
+                    break
+            else:
+                collected.append(lines)
+        self.file.seek(handoff)
+        self.partial = b""
+        return [line for lines in reversed(collected) for line in lines]
+
+    def _last_line_end(self, size:int) -> int:
+        """Offset just past the last complete line, a trailing partial line is left to the live tail."""
+        pos = size
+        while pos > 0:
+            start = max(0, pos - self.chunk_size)
+            self.file.seek(start)
+            line_end = self.file.read(pos - start).rfind(b"\n")
+            if line_end != -1:
+                return start + line_end + 1
+            pos = start
+        return 0
+
+    def reopen_if_rotated(self) -> bool:
+        """Reopen the log from the start if a new game session replaced it.
+        The path pointing at a different file catches a rotation whatever its size, shrinking below
+        our read position catches the game truncating the same file."""
+        try:
+            path_stat = stat(self.file_path)
+        except FileNotFoundError:
+            # Between the old log being moved away and the new one being created
+            return False
+        file_stat = fstat(self.file.fileno())
+        if (path_stat.st_dev, path_stat.st_ino) != (file_stat.st_dev, file_stat.st_ino) or path_stat.st_size < self.file.tell():
+            self.open()
+            return True
+        return False
@@ -0,0 +1,129 @@
+from functools import lru_cache
+from fuzzywuzzy import fuzz
+
+# fuzz.ratio() rounds 100 * SequenceMatcher.ratio(), so a score of 90 can come from a raw ratio of 0.895.
+# Pruning keeps everything above a slightly lower bound so no candidate scoring 90 is ever dropped.
+FUZZY_MIN_SCORE = 90
+FUZZY_PRUNE_RATIO = 0.89
+
+# Field pairs a list-shaped data map entry may use for (class name, human readable name)
+DATA_MAP_ENTRY_FIELDS = [
+    ("key", "value"),
+    ("class_name", "name"),
+    ("className", "name"),
+    ("id", "name"),
+]
+
+def iter_data_map(data_map):
+    """Yield (class name, human readable name) pairs from a dict or list-shaped data map."""
+    if isinstance(data_map, dict):
+        yield from data_map.items()
+        return
+    for entry in data_map:
+        if isinstance(entry, dict):
+            if len(entry) == 1:
+                yield next(iter(entry.items()))
+                continue
+            for key_field, value_field in DATA_MAP_ENTRY_FIELDS:
+                if key_field in entry and value_field in entry:
+                    yield entry[key_field], entry[value_field]
+                    break
+        elif isinstance(entry, (list, tuple)) and len(entry) == 2:
+            yield entry[0], entry[1]
+
+class NameIndex():
+    """Prefix trie over a data map's class names, built once per data map refresh.
+    Finds the longest (or shortest, for the base variant) class name that a log string starts with
+    in O(len(string)), and remembers recent answers."""
+    def __init__(self, data_map, cache_size:int=1024):
+        self.source = data_map
+        self.names = {}
+        self.trie = {}
+        for key, value in iter_data_map(data_map):
+            key = str(key)
+            if not key or key in self.names:
+                continue
+            self.names[key] = value
+            node = self.trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = key
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+        self.fuzzy_resolve = lru_cache(maxsize=cache_size)(self._fuzzy_resolve)
+        self.keys = list(self.names)
+        self.keys_by_length = None
+        self.bigram_postings = None
+
+    def items(self):
+        return self.names.items()
+
+    def _resolve(self, src_string:str, base_variant:bool):
+        """Human readable name of the best matching class name, or None."""
+        best_key_match = None
+        node = self.trie
+        for char in src_string:
+            node = node.get(char)
+            if node is None:
+                break
+            if "" in node:
+                best_key_match = node[""]
+                if base_variant:
+                    break
+        if best_key_match is None:
+            return None
+        return self.names[best_key_match]
+
+    def _build_fuzzy_index(self) -> None:
+        """Bucket the class names by length and build a bigram -> [(key number, count)] inverted index."""
+        self.keys_by_length = {}
+        self.bigram_postings = {}
+        for key_num, key in enumerate(self.keys):
+            self.keys_by_length.setdefault(len(key), []).append(key_num)
+            for bigram, count in self.count_bigrams(key).items():
+                self.bigram_postings.setdefault(bigram, []).append((key_num, count))
+
+    @staticmethod
+    def count_bigrams(string:str) -> dict:
+        counts = {}
+        for pos in range(len(string) - 1):
+            bigram = string[pos:pos + 2]
+            counts[bigram] = counts.get(bigram, 0) + 1
+        return counts
+
+    def fuzzy_candidates(self, src_string:str) -> list:
+        """Key numbers that could reach FUZZY_MIN_SCORE against src_string, in data map order."""
+        if self.bigram_postings is None:
+            self._build_fuzzy_index()
+        src_len = len(src_string)
+        shared = {}
+        for bigram, count in self.count_bigrams(src_string).items():
+            for key_num, key_count in self.bigram_postings.get(bigram, ()):
+                shared[key_num] = shared.get(key_num, 0) + min(count, key_count)
+        candidates = []
+        for key_len, key_nums in self.keys_by_length.items():
+            total = src_len + key_len
+            if 2 * min(src_len, key_len) < FUZZY_PRUNE_RATIO * total:
+                continue
+            max_edits = int(total * (1 - FUZZY_PRUNE_RATIO))
+            needed = max(src_len, key_len) - 1 - 2 * max_edits
+            if needed <= 0:
+                candidates.extend(key_nums)
+            else:
+                candidates.extend(key_num for key_num in key_nums if shared.get(key_num, 0) >= needed)
+        candidates.sort()
+        return candidates
+
+    def _fuzzy_resolve(self, src_string:str):
+        """Human readable name of the best fuzz.ratio >= 90 class name, or None.
+        Scores only the pruned candidates but picks the winner exactly like the full scan always has."""
+        fuzzy_found_dict = {}
+        for key_num in self.fuzzy_candidates(src_string):
+            key = self.keys[key_num]
+            pts = fuzz.ratio(key, src_string)
+            if pts >= FUZZY_MIN_SCORE:
+                fuzzy_found_dict[self.names[key]] = pts
+        if len(fuzzy_found_dict) > 0:
+            # Sort the fuzzy matches by their score and return the best match
+            sorted_fuzzy = dict(sorted(fuzzy_found_dict.items(), key=lambda item: item[1], reverse=True))
+            return list(sorted_fuzzy.keys())[0]
+        return None
@@ -0,0 +1,71 @@
+from threading import Event
+from time import monotonic
+from psutil import process_iter, NoSuchProcess, AccessDenied
+
+# Processes the kill tracker watches
+LAUNCHER_PROCESS = "RSI Launcher.exe"
+GAME_PROCESS = "StarCitizen_Launcher.exe"
+# Seconds a process that logged its shutdown counts as stopped, in case it hangs on or outlives the quit
+EXIT_GRACE = 60
+
+class ProcessWatcher():
+    """Keeps track of a few named processes by PID instead of walking the process table on every check.
+    A cached process is re-validated with psutil's is_running(), which compares the create time so a
+    reused PID is never mistaken for the original process. The full process table is only scanned
+    when a process isn't known yet or has gone away."""
+    def __init__(self, process_names:list):
+        self.log = None
+        self.process_names = {process_name.lower() for process_name in process_names}
+        self.processes = {}
+        self.exited = {}
+        self.exit_event = Event()
+
+    def scan(self) -> None:
+        """Walk the process table once, picking up every watched process."""
+        found = {}
+        for proc in process_iter(['name', 'exe']):
+            name = proc.info['name']
+            if not name:
+                continue
+            name = name.lower()
+            if name in self.process_names and name not in found:
+                found[name] = (proc, proc.info['exe'])
+        self.processes = found
+
+    def _alive(self, proc) -> bool:
+        try:
+            return proc.is_running()
+        except (NoSuchProcess, AccessDenied):
+            return False
+
+    def find(self, process_name:str) -> str:
+        """Executable path of a running process, or an empty string if it isn't running."""
+        name = process_name.lower()
+        entry = self.processes.get(name)
+        if entry is None or not self._alive(entry[0]):
+            self.scan()
+            entry = self.processes.get(name)
+        if entry is None:
+            return ""
+        # The process logged its shutdown, count it as stopped while it finishes exiting
+        exited = self.exited.get(name)
+        if exited and exited[0] is entry[0] and monotonic() - exited[1] < EXIT_GRACE:
+            return ""
+        if exited and exited[0] is entry[0] and self.log:
+            self.log.debug(f"ProcessWatcher.find(): {process_name} is still running {EXIT_GRACE}s after its shutdown, counting it as running again.")
+        self.exited.pop(name, None)
+        return entry[1] or ""
+
+    def signal_exit(self, process_name:str) -> None:
+        """Mark the current instance of a process as exited for up to EXIT_GRACE seconds ahead of it leaving the process table, and wake wait()."""
+        name = process_name.lower()
+        entry = self.processes.get(name)
+        if entry:
+            self.exited[name] = (entry[0], monotonic())
+        self.exit_event.set()
+
+    def wait(self, timeout:float) -> bool:
+        """Sleep for timeout seconds or until signal_exit() is called. Returns True if woken by an exit signal."""
+        signaled = self.exit_event.wait(timeout)
+        self.exit_event.clear()
+        return signaled
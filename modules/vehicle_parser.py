@@ -0,0 +1,52 @@
+import re
+from sys import intern
+from functools import lru_cache
+
+# Import kill tracker modules
+from modules.kill_rules import compile_literal_set
+from modules.name_index import iter_data_map
+
+class VehicleParser():
+    """Splits vehicle entity names like AEGS_Gladius_12345 into (ship type, ship id).
+    Results are cached per raw entity string and shared by every handler that sees vehicles,
+    the same few entities show up in the log over and over."""
+    # Entity named in a control token line: "... control token for 'AEGS_Gladius_12345' ..."
+    CONTROL_TOKEN_ENTITY = re.compile(r"for '([\w]+(?:_[\w]+)+_\d+)'")
+
+    def __init__(self, manufacturers:list, cache_size:int=1024):
+        self.manufacturers = list(manufacturers)
+        self.prefix_regex = None
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+        self.set_vehicles([])
+
+    def set_vehicles(self, vehicles_data_map) -> None:
+        """Rebuild the manufacturer matcher from the built-in codes plus those of the server's vehicle class names."""
+        codes = set(self.manufacturers)
+        for class_name, _ in iter_data_map(vehicles_data_map):
+            class_name = str(class_name)
+            if "_" in class_name:
+                codes.add(class_name[:class_name.index("_")])
+        self.prefix_regex = re.compile(compile_literal_set(sorted(codes)))
+        self.parse.cache_clear()
+
+    def _parse(self, entity:str):
+        """(ship type, ship id, made by a known manufacturer) for an entity name, or None if it has no id suffix."""
+        split = entity.rfind("_")
+        if split == -1:
+            return None
+        return (intern(entity[:split]), intern(entity[split + 1:]), self.prefix_regex.match(entity) is not None)
+
+    def parse_control_token(self, line:str):
+        """(ship type, ship id) of the vehicle a control token line is about, or None."""
+        match = self.CONTROL_TOKEN_ENTITY.search(line)
+        if not match:
+            return None
+        ship_type, ship_id, _ = self.parse(match.group(1))
+        return ship_type, ship_id
+
+    def parse_vehicle(self, entity:str):
+        """(ship type, ship id) if the entity is a vehicle from a known manufacturer, else None."""
+        vehicle = self.parse(entity)
+        if vehicle is None or not vehicle[2]:
+            return None
+        return vehicle[0], vehicle[1]
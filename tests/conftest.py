@@ -0,0 +1,93 @@
+import sys
+import json
+import hashlib
+import logging
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+
+# Let the tests import the kill tracker modules from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Import kill tracker modules
+from modules.api_client import API_Client
+from modules.data_map_cache import DataMapCache
+from modules.http_transport import HttpTransport
+from modules.kill_outbox import KillOutbox
+
+class GrimReaperStub(ThreadingHTTPServer):
+    """Local stand-in for GrimReaperBot. Counts the TCP connections it accepts and records every request.
+    POSTs answer with the status set in statuses for their path, data maps are served from data_maps with an ETag."""
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        self.connections = 0
+        self.requests = []
+        self.responses = []
+        self.statuses = {}
+        self.data_maps = {}
+        self.etags = True
+
+    def get_request(self):
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+class GrimReaperHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def reply(self, status:int, body:bytes=b"", headers:dict=None) -> None:
+        self.server.responses.append(status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, dict(self.headers), None))
+        data_type = self.path.rsplit("/", 1)[-1]
+        body = json.dumps({data_type: self.server.data_maps.get(data_type, [])}).encode()
+        if not self.server.etags:
+            self.reply(200, body)
+            return
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.reply(304, headers={"ETag": etag})
+        else:
+            self.reply(200, body, {"ETag": etag})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+        self.server.requests.append(("POST", self.path, dict(self.headers), body))
+        self.reply(self.server.statuses.get(self.path, 200), json.dumps({"discord_id": "1234"}).encode())
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def grim_reaper():
+    server = GrimReaperStub(("127.0.0.1", 0), GrimReaperHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def api(grim_reaper, tmp_path):
+    """An API_Client with a valid key talking to the local GrimReaperBot stand-in, its outbox and data map cache in tmp_path."""
+    cfg_handler = SimpleNamespace(outbox=KillOutbox(tmp_path / "bwc_killtracker.outbox"), cfg_dict={})
+    api = API_Client(cfg_handler, SimpleNamespace(async_loading_animation=lambda: None), {"active": True}, "1.0", {"current": "1234"}, {"current": "Player"})
+    api.log = api.kill_uploader.log = logging.getLogger("tests")
+    api.api_key["value"] = "key"
+    api.transport = HttpTransport(f"http://127.0.0.1:{grim_reaper.server_port}", api.api_key, "Killtracker/test")
+    api.data_map_cache = DataMapCache(tmp_path / "bwc_killtracker.datamaps")
+    yield api
+    api.kill_uploader.stop()
+    api.transport.close()
+    cfg_handler.outbox.close()
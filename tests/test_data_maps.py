@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+# Import kill tracker modules
+import modules.api_client
+from modules.api_client import diff_data_maps
+
+WEAPONS = [{"klwe_rifle_energy_01": "Karna Rifle"}, {"behr_lmg_ballistic_01": "FS-9 LMG"}]
+
+@pytest.fixture
+def updates(api):
+    """Every weapons map handed to the data map listeners."""
+    updates = []
+    api.add_data_map_listener("weapons", updates.append)
+    return updates
+
+def test_not_modified_skips_listeners(grim_reaper, api, updates):
+    grim_reaper.data_maps["weapons"] = WEAPONS
+    api.get_data_map("weapons")
+    etag = api.data_map_etags["weapons"]
+    api.get_data_map("weapons")
+
+    (_, _, first_headers, _), (_, _, second_headers, _) = grim_reaper.requests
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == etag
+    assert grim_reaper.responses == [200, 304]
+    assert updates == [WEAPONS]
+    assert api.sc_data["weapons"] == WEAPONS
+    assert api.connection_healthy
+    # Both requests went over the same keep-alive connection, the bodiless 304 did not break it
+    assert grim_reaper.connections == 1
+
+def test_unchanged_body_skips_the_diff(grim_reaper, api, updates, monkeypatch):
+    diffs = []
+    def counting_diff(old_data, new_data):
+        diffs.append(new_data)
+        return diff_data_maps(old_data, new_data)
+    monkeypatch.setattr(modules.api_client, "diff_data_maps", counting_diff)
+    grim_reaper.etags = False
+    grim_reaper.data_maps["weapons"] = WEAPONS
+    api.get_data_map("weapons")
+    api.get_data_map("weapons")
+
+    assert "If-None-Match" not in grim_reaper.requests[1][2]
+    assert grim_reaper.responses == [200, 200]
+    assert diffs == [WEAPONS]
+    assert updates == [WEAPONS]
+
+def test_changed_map_notifies_listeners(grim_reaper, api, updates):
+    grim_reaper.data_maps["weapons"] = WEAPONS
+    api.get_data_map("weapons")
+    grim_reaper.data_maps["weapons"] = WEAPONS + [{"gmni_sniper_ballistic_01": "A03 Sniper Rifle"}]
+    api.get_data_map("weapons")
+
+    assert updates == [WEAPONS, grim_reaper.data_maps["weapons"]]
+    # The new version's ETag replaced the old one
+    assert grim_reaper.requests[1][2]["If-None-Match"] != api.data_map_etags["weapons"]
+
+def canonical(entries:list) -> list:
+    return sorted(json.dumps(entry, sort_keys=True) for entry in entries)
+
+def test_diff_data_maps_lists():
+    old = [{"a": "A"}, {"b": "B"}, {"c": "C"}]
+    new = [{"a": "A"}, {"b": "B2"}, {"d": "D"}]
+    added, removed = diff_data_maps(old, new)
+    # A changed entry is removed in its old form and added in its new one
+    assert canonical(added) == canonical([{"b": "B2"}, {"d": "D"}])
+    assert canonical(removed) == canonical([{"b": "B"}, {"c": "C"}])
+
+def test_diff_data_maps_dicts():
+    added, removed = diff_data_maps({"a": "A", "b": "B", "c": "C"}, {"a": "A", "b": "B2", "d": "D"})
+    assert sorted(added) == [("b", "B2"), ("d", "D")]
+    assert sorted(removed) == [("b", "B"), ("c", "C")]
+
+def test_diff_data_maps_ignores_order_and_key_order():
+    old = [{"victim": "PU_Pilots", "zone": "any"}, {"victim": "NPC_Archetypes"}]
+    new = [{"victim": "NPC_Archetypes"}, {"zone": "any", "victim": "PU_Pilots"}]
+    assert diff_data_maps(old, new) == ([], [])
@@ -0,0 +1,33 @@
+from queue import Queue
+
+# Import kill tracker modules
+from modules.commander_mode.cm_core import CM_Core
+from modules.http_transport import HttpTransport
+
+def test_api_and_commander_share_one_connection(grim_reaper, api):
+    cm = CM_Core(None, api, {"active": True}, {"active": True}, {"current": "Player"}, {"current": "N/A"}, Queue())
+    cm.log = api.log
+    kill_result = {"player": "Player", "victim": "Victim", "time": "2025-01-01T00:00:00.000Z", "zone": "Zone", "weapon": "Weapon"}
+
+    assert api.validate_api_key("key")
+    api.get_data_map("weapons")
+    assert api.post_kill_event(kill_result)
+    cm.post_heartbeat_event(None, None, "Cutlass")
+
+    assert [path for _, path, _, _ in grim_reaper.requests] == ["/validateKey", "/data_map/weapons", "/reportKill", "/validateKey"]
+    assert grim_reaper.connections == 1
+
+def test_content_type_only_on_posts(grim_reaper, api):
+    api.transport.get("data_map/zones")
+    api.transport.post("reportKill", json={})
+
+    (_, _, get_headers, _), (_, _, post_headers, _) = grim_reaper.requests
+    assert "content-type" not in {name.lower() for name in get_headers}
+    assert post_headers["content-type"] == "application/json"
+    assert get_headers["Authorization"] == post_headers["Authorization"] == "key"
+
+def test_endpoint_timeouts():
+    transport = HttpTransport("http://127.0.0.1", {"value": None}, "Killtracker/test", default_timeout=7)
+    assert transport.timeout("data_map/weapons") == (5, 30)
+    assert transport.timeout("reportKills") == (5, 30)
+    assert transport.timeout("unknown") == 7
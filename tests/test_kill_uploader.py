@@ -0,0 +1,84 @@
+from time import monotonic, sleep
+
+# Import kill tracker modules
+from modules.kill_dedup import KillDedup
+
+def kill(i:int) -> dict:
+    return {"result": "killer", "data": {"time": f"2025-01-01T00:00:{i:02d}.000Z", "player": "Player", "victim": f"Victim{i}", "weapon": "Weapon", "zone": "Zone"}}
+
+def wait_until(condition, timeout:float=5) -> None:
+    deadline = monotonic() + timeout
+    while not condition():
+        assert monotonic() < deadline, "timed out"
+        sleep(0.01)
+
+def posts(grim_reaper) -> list:
+    """(path, headers, body) of every POST the stand-in received."""
+    return [(path, headers, body) for method, path, headers, body in grim_reaper.requests if method == "POST"]
+
+def test_kills_submitted_together_go_out_in_one_batch(grim_reaper, api):
+    kills = [kill(i) for i in range(3)]
+    for kill_result in kills:
+        api.kill_uploader.submit(kill_result)
+    wait_until(lambda: grim_reaper.requests)
+    sleep(api.kill_uploader.linger)
+
+    [(path, _, body)] = posts(grim_reaper)
+    assert path == "/reportKills"
+    assert [entry["idempotency_key"] for entry in body["kills"]] == [KillDedup.idempotency_key(kill_result) for kill_result in kills]
+    assert all(KillDedup.fingerprint(kill_result) in api.posted_kills for kill_result in kills)
+
+def test_missing_batch_endpoint_falls_back_to_single_posts(grim_reaper, api):
+    grim_reaper.statuses["/reportKills"] = 404
+    kills = [kill(i) for i in range(3)]
+
+    assert api.kill_uploader.upload(kills) == [True, True, True]
+
+    (batch_path, _, batch), *single_posts = posts(grim_reaper)
+    assert batch_path == "/reportKills"
+    assert [path for path, _, _ in single_posts] == ["/reportKill"] * 3
+    # A kill keeps its idempotency key whichever endpoint carries it
+    assert [headers["Idempotency-Key"] for _, headers, _ in single_posts] == [entry["idempotency_key"] for entry in batch["kills"]]
+    assert [body for _, _, body in single_posts] == kills
+
+    # The batch endpoint is not tried again until batch_retry has passed
+    grim_reaper.requests.clear()
+    assert api.kill_uploader.upload([kill(3), kill(4)]) == [True, True]
+    assert [path for path, _, _ in posts(grim_reaper)] == ["/reportKill", "/reportKill"]
+
+def test_failed_kills_reach_the_outbox(grim_reaper, api):
+    grim_reaper.statuses.update({"/reportKills": 503, "/reportKill": 503})
+    kills = [kill(i) for i in range(2)]
+    for kill_result in kills:
+        api.kill_uploader.submit(kill_result)
+    outbox = api.cfg_handler.outbox
+    wait_until(lambda: outbox.depth == 2)
+
+    assert [kill_result for _, kill_result in outbox.peek()] == kills
+    assert not any(KillDedup.fingerprint(kill_result) in api.posted_kills for kill_result in kills)
+
+def test_kill_stays_in_the_outbox_until_posted(grim_reaper, api):
+    grim_reaper.statuses["/reportKill"] = 503
+    outbox = api.cfg_handler.outbox
+    kill_result = kill(0)
+    api.store_kill_event(kill_result)
+    api.kill_uploader.submit(kill_result)
+    api.kill_uploader.stop()
+    assert outbox.depth == 1
+
+    grim_reaper.statuses.clear()
+    api.kill_uploader.submit(kill_result)
+    api.kill_uploader.stop()
+    assert outbox.depth == 0
+    assert grim_reaper.responses == [503, 200]
+
+def test_stop_posts_queued_kills_without_lingering(grim_reaper, api):
+    api.kill_uploader.linger = 30
+    for i in range(2):
+        api.kill_uploader.submit(kill(i))
+    start = monotonic()
+    api.kill_uploader.stop()
+
+    assert monotonic() - start < 5
+    assert not api.kill_uploader.thread.is_alive()
+    assert [path for path, _, _ in posts(grim_reaper)] == ["/reportKills"]
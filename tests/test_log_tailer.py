@@ -0,0 +1,68 @@
+import sys
+from threading import Thread, Event
+from time import monotonic, sleep
+
+import pytest
+
+from modules.log_tailer import LogWatcher, LogTailer
+
+MARKERS = [("CActor::Kill", "kill")]
+KILL_LINE = "<2025-01-01T00:00:00.000Z> [Notice] <Actor Death> CActor::Kill: 'Victim' killed by 'Player'\n"
+
+def follow(tailer:LogTailer, watcher:LogWatcher, dispatched:list, stop:Event) -> None:
+    """The read/wait loop of LogParser.read_channels(), recording when each marker line is dispatched."""
+    while not stop.is_set():
+        lines = tailer.read_chunk_lines()
+        if lines is None:
+            watcher.wait()
+            continue
+        for line, events in lines:
+            dispatched.append((monotonic(), line, events))
+
+def append_latency(tmp_path, watcher:LogWatcher, idle:float) -> float:
+    log_path = tmp_path / "Game.log"
+    log_path.write_text("<2025-01-01T00:00:00.000Z> Log started\n")
+    tailer = LogTailer(str(log_path), watcher, MARKERS)
+    tailer.open(at_end=True)
+    dispatched = []
+    stop = Event()
+    thread = Thread(target=follow, args=(tailer, watcher, dispatched, stop), daemon=True)
+    thread.start()
+    try:
+        # Let the watcher settle into its idle wait before the game writes
+        sleep(idle)
+        appended = monotonic()
+        with open(log_path, "a") as f:
+            f.write("<2025-01-01T00:00:01.000Z> [Notice] unrelated line\n")
+            f.write(KILL_LINE)
+        deadline = appended + 5
+        while not dispatched and monotonic() < deadline:
+            sleep(0.005)
+    finally:
+        stop.set()
+        # Wake a pending wait so the loop can exit
+        with open(log_path, "a") as f:
+            f.write("\n")
+        thread.join(5)
+        tailer.close()
+        watcher.close()
+    assert len(dispatched) == 1
+    dispatched_at, line, events = dispatched[0]
+    assert line == KILL_LINE
+    assert list(events) == ["kill"]
+    return dispatched_at - appended
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_dispatches_appended_line_promptly(tmp_path):
+    watcher = LogWatcher(max_interval=4.0)
+    assert watcher.uses_inotify
+    # inotify wakes the tailer on the write, far sooner than the 4s fallback timeout
+    assert append_latency(tmp_path, watcher, idle=0.5) < 0.25
+
+def test_polling_dispatches_appended_line_within_max_interval(tmp_path):
+    watcher = LogWatcher(min_interval=0.05, max_interval=0.4)
+    # Force the polling path used where inotify is unavailable
+    watcher.close()
+    assert not watcher.uses_inotify
+    # Idle long enough for the poll interval to back off to max_interval
+    assert append_latency(tmp_path, watcher, idle=1.5) < 0.4 + 0.25
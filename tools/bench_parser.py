@@ -0,0 +1,185 @@
+"""Microbenchmarks for the Game.log parser hot path.
+
+    python tools/gen_game_log.py /tmp/Game.log --size-mb 100
+    python tools/bench_parser.py /tmp/Game.log
+
+Reports lines/s, MB/s, the cost per line of each event type and the peak Python memory of every stage.
+"""
+import sys
+import argparse
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Import kill tracker modules
+from modules.log_parser import LogParser, LOG_MARKERS
+from modules.log_record import LogRecord
+from modules.line_classifier import LineClassifier, EVENT_KILL
+from modules.identity_scanner import IdentityScanner
+from modules.kill_dedup import KillDedup
+from tools.gen_game_log import HANDLE, GEID, SHIPS, WEAPONS, ZONES
+
+CHUNK_SIZE = 1 << 20
+
+class NullLog():
+    """Swallows the parser's log calls so the benchmark measures parsing, not logging."""
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+class NullLabel():
+    def config(self, **kwargs):
+        pass
+
+class BenchGUI(NullLog):
+    def __init__(self):
+        self.api_status_label = NullLabel()
+        self.curr_killstreak_label = NullLabel()
+        self.max_killstreak_label = NullLabel()
+        self.session_kills_label = NullLabel()
+        self.session_deaths_label = NullLabel()
+        self.kd_ratio_label = NullLabel()
+
+class BenchCfgHandler():
+    cfg_dict = {"ping": False}
+
+class BenchAPI(NullLog):
+    """Just the pieces of API_Client the parser reads, with data maps shaped like the server's."""
+    def __init__(self):
+        self.api_key = {"value": "bench"}
+        self.cfg_handler = BenchCfgHandler()
+        self.sc_data = {
+            "weapons": {weapon: weapon.replace("_", " ") for weapon in WEAPONS},
+            "vehicles": [{ship: ship.replace("_", " ")} for ship in SHIPS],
+            "zones": [{zone: zone.replace("_", " ")} for zone in ZONES],
+            "gameModes": [],
+            "ignoredVictimRules": [
+                {"type": "substring", "value": "Kopion"},
+                {"type": "startsWith", "value": "PU_Human_Enemy"},
+                {"type": "regex", "value": r"NPC_Archetypes-Human-\w+"},
+            ],
+        }
+        # Pad the maps to a realistic size
+        for n in range(2000):
+            self.sc_data["weapons"][f"XXXX_Weapon_{n}_S{n % 10}"] = f"Weapon {n}"
+            self.sc_data["vehicles"].append({f"XXXX_Vehicle_{n}": f"Vehicle {n}"})
+            self.sc_data["zones"].append({f"Zone_{n}_Outpost": f"Outpost {n}"})
+
+def make_parser() -> LogParser:
+    parser = LogParser(
+        BenchGUI(), BenchAPI(), NullLog(), NullLog(), "bench", {"active": True}, {"current": "0"},
+        {"current": HANDLE}, {"current": GEID}, {"current": "FPS"}, {"enabled": False}
+    )
+    parser.log = NullLog()
+    # Measure the parser alone, without handing events to the sink threads
+    parser.pipeline.sinks.clear()
+    return parser
+
+def scan_file(file_path:str, classifier:LineClassifier) -> list:
+    """Stage 1: what LogTailer does per chunk, returns every (line, events) pair."""
+    lines = []
+    with open(file_path, "rb") as f:
+        partial = b""
+        while True:
+            data = f.read(CHUNK_SIZE)
+            if not data:
+                break
+            data = partial + data
+            line_end = data.rfind(b"\n") + 1
+            partial = data[line_end:]
+            lines.extend(classifier.scan(data, line_end))
+    return lines
+
+def measure(stage, repeat:int=1):
+    """Run stage and return (best seconds, peak traced bytes, result). Peak memory comes from a separate traced run."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = stage()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    stage()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+def report(name:str, seconds:float, peak:int, count:int, unit:str="lines", size:int=None) -> None:
+    rate = count / seconds if seconds else float("inf")
+    per_item = seconds / count * 1e6 if count else 0.0
+    size_rate = f" {size / 1e6 / seconds:8.1f} MB/s" if size else " " * 14
+    print(f"{name:<32} {count:>9} {unit:<6} {seconds * 1000:9.1f} ms {rate:>12,.0f} {unit}/s {per_item:8.2f} us/{unit[:-1]}{size_rate} peak {peak / 1e6:7.2f} MB")
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the Game.log parser stages.")
+    arg_parser.add_argument("log_file", help="Game.log to parse, see tools/gen_game_log.py")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per stage, the best time is reported")
+    args = arg_parser.parse_args()
+    file_size = Path(args.log_file).stat().st_size
+    with open(args.log_file, "rb") as f:
+        total_lines = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(CHUNK_SIZE), b""))
+    parser = make_parser()
+    markers = LOG_MARKERS + [(IdentityScanner.HANDLE_MARKER, "identity"), (IdentityScanner.GEID_MARKER, "identity")]
+
+    print(f"{args.log_file}: {file_size / 1e6:.1f} MB, {total_lines} lines\n")
+    seconds, peak, marker_lines = measure(lambda: scan_file(args.log_file, LineClassifier(markers)), args.repeat)
+    report("scan + classify", seconds, peak, total_lines, size=file_size)
+
+    by_event = {}
+    for line, events in marker_lines:
+        if events:
+            by_event.setdefault(events[0], []).append((line, events))
+
+    def dispatch(lines):
+        def run():
+            # Every run has to handle its kills as new ones, not as duplicates of the previous run
+            parser.kill_dedup = KillDedup()
+            for line, events in lines:
+                parser.read_log_line(line, True, events)
+        return run
+
+    for event, lines in by_event.items():
+        seconds, peak, _ = measure(dispatch(lines), args.repeat)
+        report(f"read_log_line [{event}]", seconds, peak, len(lines))
+
+    seconds, peak, _ = measure(dispatch(marker_lines), args.repeat)
+    report("read_log_line [all]", seconds, peak, len(marker_lines))
+
+    kill_lines = by_event.get(EVENT_KILL, [])
+    own_kills = [LogRecord(line) for line, _ in kill_lines if HANDLE in line]
+    seconds, peak, results = measure(lambda: [parser.parse_kill_line(record) for record in own_kills], args.repeat)
+    report("parse_kill_line", seconds, peak, len(own_kills))
+    def process_kills():
+        parser.kill_dedup = KillDedup()
+        return [parser.process_kill(record) for record in own_kills]
+
+    seconds, peak, _ = measure(process_kills, args.repeat)
+    report("process_kill", seconds, peak, len(own_kills))
+
+    rules = parser.api.sc_data["ignoredVictimRules"]
+    seconds, peak, _ = measure(lambda: [parser.check_ignored_victims(rules, line) for line, _ in kill_lines], args.repeat)
+    report("check_ignored_victims", seconds, peak, len(kill_lines))
+
+    weapons = [result["data"]["weapon"] for result in results if result["data"]]
+    zones = [result["data"]["zone"] for result in results if result["data"]]
+    weapon_map = parser.api.sc_data["weapons"]
+
+    def cold(stage):
+        def run():
+            parser.name_indexes.clear()
+            return stage()
+        return run
+
+    convert_weapons = lambda: [parser.convert_string(weapon_map, weapon, False, False) for weapon in weapons]
+    convert_zones = lambda: [parser.convert_zone_string(zone) for zone in zones]
+    for name, stage in (("convert_string [weapon]", convert_weapons), ("convert_zone_string", convert_zones)):
+        seconds, peak, _ = measure(cold(stage), args.repeat)
+        report(f"{name} cold", seconds, peak, len(weapons))
+        stage()
+        seconds, peak, _ = measure(stage, args.repeat)
+        report(f"{name} warm", seconds, peak, len(weapons))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Generate synthetic Star Citizen Game.log files for benchmarking the log parser.
+
+    python tools/gen_game_log.py Game.log --size-mb 100 --kill-density 0.002
+"""
+import sys
+import random
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+HANDLE = "TestPlayer"
+GEID = "200146295000"
+GAME_MODES = ["SC_Default", "EA_FreeFlight", "EA_SquadronBattle", "EA_Elimination"]
+SHIPS = [
+    "ANVL_Hornet_F7A_Mk2", "AEGS_Gladius", "DRAK_Cutlass_Black", "ORIG_300i", "RSI_Aurora_MR",
+    "MISC_Freelancer", "CRUS_Starfighter_Ion", "KRIG_P52_Merlin", "ESPR_Talon", "GAMA_Syulen",
+]
+WEAPONS = [
+    "KLWE_LaserRepeater_S3", "BEHR_LaserCannon_S2", "AMRS_LaserCannon_S1", "MXOX_NeutronRepeater_S3",
+    "behr_rifle_ballistic_01", "ksar_smg_energy_01", "gmni_sniper_ballistic_01", "klwe_pistol_energy_01",
+]
+ZONES = ["Stanton", "Stanton1_Hurston", "Stanton2_Crusader", "Stanton4_Microtech", "OOC_Stanton_1_Hurston", "Pyro"]
+NPC_VICTIMS = ["PU_Pilots-Human-Criminal", "PU_Human_Enemy_GroundCombat_NPC_Pirate", "Kopion_Stanton", "NPC_Archetypes-Human-Outlaw"]
+PLAYERS = ["OtherPilot", "Some_Player", "xXSniperXx", "QuietOne", "CitizenKane"]
+
+# Fraction of all lines per event type, the rest is noise
+DEFAULT_DENSITIES = {
+    "context_establisher": 0.00005,
+    "control_flow": 0.0005,
+    "zone_enter": 0.002,
+    "jump_drive": 0.0002,
+    "vehicle_destruction": 0.0002,
+    "kill": 0.0015,
+    "death": 0.0003,
+    "suicide": 0.0001,
+    "reset": 0.0001,
+    "other_kill": 0.001,
+}
+
+NOISE = [
+    "[Notice] <ContextEstablisherTask> Task {n} finished waitingFor=0 runningTime={f:.6f} [Team_Network][Network][Loading]",
+    "[Trace] <SHUDEvent_OnNotification> Added notification \"Entered Monitored Space\" [{n}] to queue. New queue size: 1, MissionId: [00000000-0000-0000-0000-000000000000], ObjectiveId: [] [Team_CoreGameplayFeatures][Missions][Comms]",
+    "[Notice] <CEntityComponentInstancedInterior::OnEntityLeaveZone> [InstancedInterior] OnEntityLeaveZone - InstancedInterior [Room_{n}] [{id}] -> Entity [body_{n}] [{id}] -- m_openDoors[0], m_managerGEID[{id}], m_ownerGEID[{id}] [Team_(Unknown)][Cargo]",
+    "Loading entity class=EntityClass_{n} path=Data/Objects/Spaceships/Ships/Common/Geometry/part_{n}.cgf lod=0",
+    "[Notice] <StatObjLoad 0x800 Format> '{n}' Geometry has invalid format [Team_Graphics][Render]",
+    "[Notice] <AttachmentReceived> Player[{handle}] Attachment[item_{n}, Class_{n}, {id}] Status[persistent] Port[port_{n}] Elapsed[{f:.6f}] [Team_(Unknown)][Inventory]",
+]
+
+class LineFactory():
+    """Builds one realistic Game.log line per event type."""
+    def __init__(self, rng:random.Random, start:datetime):
+        self.rng = rng
+        self.time = start
+        self.entity_id = 2001462951000
+        self.ship = None
+
+    def timestamp(self) -> str:
+        self.time += timedelta(milliseconds=self.rng.randint(0, 40))
+        return "<" + self.time.strftime("%Y-%m-%dT%H:%M:%S.") + f"{self.time.microsecond // 1000:03d}Z>"
+
+    def next_id(self) -> int:
+        self.entity_id += self.rng.randint(1, 50)
+        return self.entity_id
+
+    def entity(self, class_name:str) -> str:
+        return f"{class_name}_{self.next_id()}"
+
+    def noise(self) -> str:
+        return self.rng.choice(NOISE).format(n=self.rng.randint(0, 99999), id=self.next_id(), f=self.rng.random() * 100, handle=HANDLE)
+
+    def login(self) -> str:
+        return f"[Notice] <Legacy login response> [CIG-net] User Login Success - Handle[{HANDLE}] - Time[{self.rng.randint(1, 99999)}] [Team_GameServices][Login]"
+
+    def character(self) -> str:
+        return f"[Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1 - updatedAt 1 - geid {GEID} - accountId 1 - name {HANDLE} - state STATE_CURRENT [Team_GameServices][Login]"
+
+    def context_establisher(self) -> str:
+        return f"[Notice] <Context Establisher Done> establisher=\"CReplicationModel\" runningTime={self.rng.random() * 60:.6f} map=\"megamap\" gamerules=\"{self.rng.choice(GAME_MODES)}\" sessionId=\"{self.next_id()}\" [Team_Network][Network][Replication][Loading][Persistence]"
+
+    def control_flow(self) -> str:
+        if self.ship is None:
+            self.ship = self.entity(self.rng.choice(SHIPS))
+            return f"[Notice] <Vehicle Control Flow> CVehicleMovementBase::SetDriver: Local client node [{GEID}] requesting control token for '{self.ship}' [{self.ship.rsplit('_', 1)[1]}] [Team_VehicleFeatures][Vehicle]"
+        ship, self.ship = self.ship, None
+        return f"[Notice] <Vehicle Control Flow> CVehicleMovementBase::ClearDriver: Local client node [{GEID}] releasing control token for '{ship}' [{ship.rsplit('_', 1)[1]}] [Team_VehicleFeatures][Vehicle]"
+
+    def zone_enter(self) -> str:
+        zone = self.ship or self.entity(self.rng.choice(SHIPS))
+        return f"[Notice] <CEntityComponentInstancedInterior::OnEntityEnterZone> [InstancedInterior] OnEntityEnterZone - InstancedInterior [{zone}] [{self.next_id()}] -> Entity [{HANDLE}] [{GEID}] -- m_openDoors[0], m_managerGEID[{self.next_id()}], m_ownerGEID[{GEID}] [Team_(Unknown)][Cargo]"
+
+    def jump_drive(self) -> str:
+        ship = self.ship or self.entity(self.rng.choice(SHIPS))
+        return f"[Notice] <Jump Drive State Changed> Now Idle : Local client node [{GEID}] adam: {ship} in zone {self.rng.choice(ZONES)} (pos: 0.0 0.0 0.0) [Team_VehicleFeatures][Vehicle]"
+
+    def vehicle_destruction(self) -> str:
+        ship = self.entity(self.rng.choice(SHIPS))
+        return f"[Notice] <Vehicle Destruction> CVehicle::OnAdvanceDamageLevel: Vehicle '{ship}' [{ship.rsplit('_', 1)[1]}] in zone '{self.rng.choice(ZONES)}' [pos x: 0, y: 0, z: 0 vel x: 0, y: 0, z: 0] driven by '{self.rng.choice(PLAYERS)}' [{self.next_id()}] advanced from destroy level 0 to 1 caused by '{HANDLE}' [{GEID}] with 'Combat' [Team_VehicleFeatures][Vehicle]"
+
+    def actor_kill(self, victim:str, victim_id, zone:str, killer:str, killer_id, weapon:str, damage:str) -> str:
+        return f"[Notice] <Actor Death> CActor::Kill: '{victim}' [{victim_id}] in zone '{zone}' killed by '{killer}' [{killer_id}] using '{weapon}' [Class {weapon.rsplit('_', 1)[0]}] with damage type '{damage}' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]"
+
+    def kill_zone(self) -> str:
+        return self.ship or self.entity(self.rng.choice(SHIPS))
+
+    def kill(self) -> str:
+        victim = self.entity(self.rng.choice(NPC_VICTIMS + PLAYERS))
+        return self.actor_kill(victim, self.next_id(), self.kill_zone(), HANDLE, GEID, self.entity(self.rng.choice(WEAPONS)), "Bullet")
+
+    def death(self) -> str:
+        return self.actor_kill(HANDLE, GEID, self.kill_zone(), self.rng.choice(PLAYERS), self.next_id(), self.entity(self.rng.choice(WEAPONS)), "Bullet")
+
+    def suicide(self) -> str:
+        return self.actor_kill(HANDLE, GEID, self.kill_zone(), HANDLE, GEID, self.rng.choice(["Crash", "SelfDestruct", "Suicide"]), "Suicide")
+
+    def reset(self) -> str:
+        return self.actor_kill(self.entity(self.rng.choice(NPC_VICTIMS)), self.next_id(), self.kill_zone(), "unknown", 0, "unknown", "Crash")
+
+    def other_kill(self) -> str:
+        return self.actor_kill(self.entity(self.rng.choice(NPC_VICTIMS)), self.next_id(), self.rng.choice(ZONES), self.rng.choice(PLAYERS), self.next_id(), self.entity(self.rng.choice(WEAPONS)), "Bullet")
+
+def generate_log(out, target_bytes:int, densities:dict=None, seed:int=1) -> dict:
+    """Write about target_bytes of Game.log lines to out, returning how many lines of each type were written."""
+    densities = densities or DEFAULT_DENSITIES
+    rng = random.Random(seed)
+    factory = LineFactory(rng, datetime(2025, 1, 1, 10, 0, 0))
+    event_types = list(densities)
+    # Cumulative thresholds so one random() picks the line type
+    thresholds = []
+    total = 0.0
+    for event_type in event_types:
+        total += densities[event_type]
+        thresholds.append(total)
+    counts = {event_type: 0 for event_type in event_types}
+    counts["noise"] = 0
+    written = 0
+    batch = []
+    for make_line in (factory.login, factory.character, factory.context_establisher):
+        batch.append(f"{factory.timestamp()} {make_line()}\n")
+    while written < target_bytes:
+        pick = rng.random()
+        for index, threshold in enumerate(thresholds):
+            if pick < threshold:
+                event_type = event_types[index]
+                line = getattr(factory, event_type)()
+                break
+        else:
+            event_type = "noise"
+            line = factory.noise()
+        counts[event_type] += 1
+        line = f"{factory.timestamp()} {line}\n"
+        written += len(line)
+        batch.append(line)
+        if len(batch) >= 10000:
+            out.write("".join(batch))
+            batch = []
+    out.write("".join(batch))
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Star Citizen Game.log.")
+    parser.add_argument("output", help="Path of the log file to write")
+    parser.add_argument("--size-mb", type=float, default=50, help="Approximate size of the log in MB")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--density-scale", type=float, default=1.0, help="Multiply every event density, e.g. 10 for a combat heavy session")
+    for event_type, density in DEFAULT_DENSITIES.items():
+        parser.add_argument(f"--{event_type.replace('_', '-')}-density", type=float, default=None, help=f"Fraction of lines (default {density})")
+    args = parser.parse_args()
+    densities = {}
+    for event_type, density in DEFAULT_DENSITIES.items():
+        override = getattr(args, f"{event_type}_density")
+        densities[event_type] = (density if override is None else override) * args.density_scale
+    if sum(densities.values()) >= 1:
+        sys.exit("Event densities add up to 1 or more, there would be no room for noise lines.")
+    with open(Path(args.output), "w", encoding="utf-8", newline="\n") as f:
+        counts = generate_log(f, int(args.size_mb * 1e6), densities, args.seed)
+    print(f"Wrote {args.output}: " + ", ".join(f"{event_type}={count}" for event_type, count in counts.items()))
+
+if __name__ == "__main__":
+    main()